@@ -1,16 +1,19 @@
 #!/usr/bin/env python3
 
 import argparse
+import json as JSON
+import sys
 from random import choice
-from time import time
+from time import perf_counter, time
 
 from pyrdle_core import Pyrdle
+from pyrdle_wordle import Wordle
 
-def play(challenge_mode=False):
+def play(challenge_mode=False, loc=None):
 
 	cursor = "> "
 
-	P = Pyrdle()
+	P = Pyrdle(loc)
 	
 	if challenge_mode:
 		target_word = choice(P.secret_words)
@@ -18,15 +21,15 @@ def play(challenge_mode=False):
 	else:
 		target_word = None
 
-	win = str(P.G) * 5
+	win = str(P.G) * P.word_length
 	user_guesses = 1
 	while(True):
 		
 		#Get user guess
 		while(True):
 			user_guess = input(cursor)
-			if len(user_guess) != 5:
-				print("Please enter a five-letter word.")
+			if len(user_guess) != P.word_length:
+				print(f"Please enter a {P.word_length}-letter word.")
 			elif user_guess.upper() not in P.possible_words:
 				print("Please enter a valid word.")
 			else:
@@ -52,15 +55,36 @@ def play(challenge_mode=False):
 		else:
 			user_guesses += 1
 
-def solve(pruning, n, challenge_mode=None):
+# Prints a Pyrdle's instrumentation, and/or appends it to a trace file as one
+# line of JSON.
+def report_stats(P, show=False, trace=None, **run):
+
+	if P.stats is None:
+		return
+
+	P.stats.count("transposition_hits", P.transpositions.hits)
+	P.stats.count("transposition_misses", P.transpositions.misses)
+
+	if show:
+		P.stats.print_report()
+
+	if trace is not None:
+
+		run["argv"] = sys.argv[1:]
+		run["stats"] = P.stats.report()
+
+		with open(trace, "a") as f:
+			f.write(JSON.dumps(run) + "\n")
+
+def solve(pruning, n, challenge_mode=None, jobs=1, exhaustive=False, exact=False, stats=False, trace=None, time_budget=None, loc=None):
 
 	cursor = "> "
 
-	P = Pyrdle()
+	P = Pyrdle(loc, jobs=jobs, bounded=not exhaustive, stats=stats or (trace is not None))
 	
 	if challenge_mode is not None:
-		if (len(challenge_mode) != 5):
-			print("Target word must be five letters in length.")
+		if (len(challenge_mode) != P.word_length):
+			print(f"Target word must be {P.word_length} letters in length.")
 			return
 		elif challenge_mode.upper() not in P.secret_words:
 			print("Target word must be in the list of secret words:")
@@ -71,20 +95,200 @@ def solve(pruning, n, challenge_mode=None):
 
 	T1 = time()
 
-	if pruning:
+	certificate = None
+
+	if exact:
+		solution, certificate = P.exact_search(challenge_mode)
+	elif time_budget is not None:
+		solution = None
+		for solution, width in P.anytime_search(challenge_mode, time_budget):
+			print(f"[{(time() - T1):.3f}s, width {width}] {len(solution)} guesses: {', '.join(solution)}")
+	elif pruning:
 		solution = P.recurse_tree_with_pruning(hardmode=challenge_mode, width=n)
 	else:
 		solution = P.greedy_search(challenge_mode)
 	
 	T2 = time()
+
+	P.close()
+
+	if solution is None:
+		print(f"\nNo solution found in {(T2 - T1):.6f}s: every line this solver tried lets Absurdle rule out {challenge_mode}.\n")
+		return
 	
 	print(f"\nFound the following solution in {(T2 - T1):.6f}s:")
 	print(", ".join(solution))
 	print("")
 
-def wordle():
+	if certificate is not None:
+		print(f"This solution is optimal: no solution with fewer than {certificate['optimal']} guesses exists.")
+		print(f" - No guess tells more than {certificate['max_distinct_responses']} words apart, so at least {certificate['lower_bound']} guesses are needed.")
+		for budget, refuted in sorted(certificate["refuted"].items()):
+			plural = "" if (refuted == 1) else "s"
+			print(f" - Every line of {budget} guesses was searched and refuted ({refuted} position{plural}).")
+		print("")
+
+	evaluated = P.evaluations + P.pruned
+	print(f"Evaluated {evaluated} guesses, {P.pruned} of which were abandoned early; skipped {P.equivalent} more that split the words just like one of those.")
+	print("")
+
+	if exact:
+		solver = "exact"
+	elif time_budget is not None:
+		solver = "anytime"
+	else:
+		solver = "pruning" if pruning else "greedy"
+	report_stats(P, stats, trace, solver=solver, width=n, time_budget=time_budget, target=challenge_mode, jobs=jobs, solution=solution, seconds=T2 - T1)
+
+def assist(metric="entropy", loc=None):
+
+	cursor = "> "
+
+	P = Wordle(loc, metric=metric)
+
+	print(f"After each guess, enter Wordle's response as {P.word_length} letters: G for green, Y for yellow and B for grey (e.g. {'BYBBG'[:P.word_length].ljust(P.word_length, 'B')}).\n")
+
+	user_guesses = 1
+	while(True):
+
+		suggestion = P.best_guess()
+		score = P.guess_score(suggestion)
+
+		if P.metric == "entropy":
+			print(f"Suggested guess: {suggestion} ({score:.2f} bits of information expected, {len(P.candidates)} words left)")
+		else:
+			print(f"Suggested guess: {suggestion} ({score:.2f} words expected to remain, {len(P.candidates)} words left)")
+
+		#Get user guess
+		while(True):
+			user_guess = input(f"Guess (leave blank for {suggestion}) {cursor}").upper()
+			if user_guess == "":
+				user_guess = suggestion
+				break
+			elif user_guess not in P.guess_index:
+				print("Please enter a valid word.")
+			else:
+				break
+
+		#Get the response
+		while(True):
+			code = P.parse_response(input(f"Response {cursor}"))
+			if code is None:
+				print(f"Please enter a {P.word_length}-letter response.")
+			else:
+				break
+
+		print(cursor + P.response_to_emoji(P.responses[code]) + "\n")
+
+		if code == P.win:
+			print(f"Solved in {user_guesses} guesses!")
+			break
+
+		P.update(user_guess, code)
+
+		if len(P.candidates) == 0:
+			print("No secret words fit those responses!")
+			break
+
+		user_guesses += 1
+
+def batch(metric="entropy", stats=False, trace=None, loc=None):
+
+	P = Wordle(loc, metric=metric, stats=stats or (trace is not None))
+
+	T1 = time()
+	distribution = P.solve_all()
+	T2 = time()
+
+	total = sum(distribution.values())
+	guesses = sum( k * v for k, v in distribution.items() )
+
+	print(f"\nSolved all {total} secret words in {(T2 - T1):.6f}s:")
+	for k in sorted(distribution):
+		print(f"{k} guesses: {distribution[k]:5d}")
+	print("")
+
+	print(f"Average: {(guesses / total):.4f} guesses, worst case: {max(distribution)} guesses.")
+	print("")
+
+	report_stats(P, stats, trace, solver="wordle", metric=metric, distribution=dict(sorted(distribution.items())), seconds=T2 - T1)
+
+def build_book(jobs=1, loc=None):
+
+	P = Wordle(loc, jobs=jobs)
+
+	T1 = time()
+	P.build_book()
+	T2 = time()
+
+	P.close()
+
+	print(f"Saved {len(P.book)} opening book entries to {P.book.location} in {(T2 - T1):.6f}s.")
+
+def build_tree(metric="entropy", loc=None):
+
+	P = Wordle(loc, metric=metric)
+
+	T1 = time()
+	P.build_tree()
+	T2 = time()
+
+	# The responses before every guess on the way to every secret word.
+	paths = []
+
+	for secret in P.secret_words:
+
+		codes = []
+
+		while True:
+
+			paths.append(codes[:])
+			code = P.feedback_row(P.next_guess(codes))[P.secret_index[secret]]
+
+			if code == P.win:
+				break
+
+			codes.append(code)
+
+	T3 = perf_counter()
+
+	for codes in paths:
+		P.next_guess(codes)
+
+	T4 = perf_counter()
+	lookups = len(paths)
+
+	print(f"Saved a decision tree of {len(P.tree)} guesses to {P.tree.location} in {(T2 - T1):.6f}s.")
+	print(f"Looked up the {lookups} guesses it makes for every secret word, in {1000000 * (T4 - T3) / lookups:.2f}µs each on average.")
+
+def next_guess(responses, metric="entropy", loc=None):
+
+	P = Wordle(loc, metric=metric)
+
+	codes = [ P.parse_response(r) for r in responses ]
+
+	if None in codes:
+		print(f"Please enter {P.word_length}-letter responses: G for green, Y for yellow and B for grey.")
+		return
+
+	if not P.tree.load():
+		print(f"No decision tree found at {P.tree.location}: build one with --build-tree.")
+		return
+
+	if P.win in codes:
+		print("That's already solved!")
+		return
+
+	guess = P.next_guess(codes)
+
+	if guess is None:
+		print("No secret word gets those responses to the tree's guesses.")
+	else:
+		print(guess)
+
+def wordle(loc=None):
 	
-	s = Pyrdle.do_wordle()
+	s = Pyrdle(loc).do_wordle()
 	
 	print(f"Today's wordle solution is: {s}")
 
@@ -96,18 +300,47 @@ if __name__ == "__main__":
 	parser.add_argument("-s", default=False, required=False, action="store_true", help="Find solutions.")
 	parser.add_argument("-p", default=False, required=False, action="store_true", help="Use branch pruning. This will take longer to run, but will find better solutions.")
 	parser.add_argument("-n", default=20, required=False, type=int, help="Branch pruning width. Defaults to 20 if not set.")
+	parser.add_argument("--exact", default=False, required=False, action="store_true", help="Find a provably optimal solution. This takes a minute or two in challenge mode.")
+	parser.add_argument("--time-budget", default=None, required=False, type=float, metavar="SECONDS", help="Search with ever wider branch pruning until this many seconds have passed, printing each better solution as it's found, then give the best one.")
+	parser.add_argument("-j", default=1, required=False, type=int, help="Number of worker processes to use when finding solutions. Defaults to 1 if not set.")
+	parser.add_argument("--exhaustive", default=False, required=False, action="store_true", help="Fully evaluate every guess when finding solutions, rather than abandoning guesses that can't beat the best found so far.")
+	parser.add_argument("--build-book", default=False, required=False, action="store_true", help="Precompute the opening moves for every mode, so that later solves can start straight away.")
+	parser.add_argument("--build-tree", default=False, required=False, action="store_true", help="Work out the Wordle solver's guesses for every secret word, and save them as a decision tree for --next-guess.")
+	parser.add_argument("--next-guess", default=None, required=False, nargs="*", metavar="RESPONSE", help="Look up the Wordle solver's next guess in the decision tree, given Wordle's responses to its guesses so far (none for the first guess).")
+	parser.add_argument("--stats", default=False, required=False, action="store_true", help="Print counters, timers and per-level statistics after finding solutions.")
+	parser.add_argument("--trace", default=None, required=False, type=str, metavar="FILE", help="Append the run's statistics to this file, as one line of JSON.")
 	parser.add_argument("-w", default=False, required=False, action="store_true", help="Get today's Wordle solution.")
+	parser.add_argument("-a", default=False, required=False, action="store_true", help="Get help solving a game of Wordle: Pyrdle suggests guesses, and narrows down the answer from the responses you enter.")
+	parser.add_argument("-b", default=False, required=False, action="store_true", help="Solve every Wordle secret word, and report how many guesses each one took.")
+	parser.add_argument("--words", default=None, required=False, type=str, metavar="FILE", help="Word list to use, in the same format as words.dat. Words can have from 4 to 8 letters. Defaults to ./words.dat if not set.")
+	parser.add_argument("--metric", default="entropy", required=False, choices=Wordle.metrics, help="How Wordle guesses are picked: by expected information (entropy, the default) or by the expected number of words left (expected).")
 	
 	args = parser.parse_args()
 
 	# Wordle mode.
 	if args.w:
-		wordle()
+		wordle(args.words)
+
+	elif args.build_book:
+		build_book(args.j, args.words)
+
+	elif args.build_tree:
+		build_tree(args.metric, args.words)
+
+	elif args.next_guess is not None:
+		next_guess(args.next_guess, args.metric, args.words)
+
+	# Wordle solver modes.
+	elif args.a:
+		assist(args.metric, args.words)
+
+	elif args.b:
+		batch(args.metric, args.stats, args.trace, args.words)
 
 	# Solver mode.
 	elif args.s:
-		solve(args.p, args.n, args.target)
+		solve(args.p, args.n, args.target, args.j, args.exhaustive, args.exact, args.stats, args.trace, args.time_budget, args.words)
 
 	# Play mode.
 	else:
-		play(args.c)
+		play(args.c, args.words)
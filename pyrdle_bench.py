@@ -0,0 +1,460 @@
+#!/usr/bin/env python3
+
+import argparse
+import json as JSON
+import resource
+import subprocess
+import sys
+from contextlib import redirect_stdout
+from io import StringIO
+from multiprocessing import Pool
+from os.path import abspath, dirname
+from random import Random
+from time import perf_counter, time
+
+from pyrdle_core import Pyrdle
+
+solvers = ("greedy", "pruning")
+
+# Targets for --check-exact when none are given: one won in four guesses,
+# and one whose proof has to refute every line of four.
+exact_targets = ("WHOOP", "SHAKE")
+
+# Run in a fresh interpreter by measure_startup: prints the time once the
+# first guess has been answered.
+startup_script = "from time import time; from pyrdle_core import Pyrdle; P = Pyrdle({location!r}); P.adversarial_match(P.possible_words[0]); print(time())"
+
+# Solver process state.
+solver = None
+
+def init_solver(location):
+
+	global solver
+	solver = Pyrdle(location)
+
+# Solves challenge mode for one target, recording how it went. Memory use
+# is only known as the process's high-water mark (in KB), so a target gets
+# how far its solve raised that, and the mark itself once it's done.
+def run_target(task):
+
+	method, target, width = task
+
+	evaluations = solver.evaluations
+	pruned = solver.pruned
+	equivalent = solver.equivalent
+	memory = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+	T1 = perf_counter()
+
+	# The solvers print as they go, which isn't wanted here.
+	with redirect_stdout(StringIO()):
+
+		if method == "greedy":
+			solution = solver.greedy_search(hardmode=target)
+		else:
+			solution = solver.recurse_tree_with_pruning(hardmode=target, width=width)
+
+	T2 = perf_counter()
+
+	peak_memory = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+	return (method, target, {
+		"guesses" : solution,
+		"time" : T2 - T1,
+		"evaluations" : solver.evaluations - evaluations,
+		"pruned" : solver.pruned - pruned,
+		"equivalent" : solver.equivalent - equivalent,
+		"memory_growth" : peak_memory - memory,
+		"process_peak_memory" : peak_memory,
+	})
+
+# Time from launching a new Python process to its first adversarial_match.
+def measure_startup(location, runs=10):
+
+	script = startup_script.format(location=abspath(location))
+	times = []
+
+	for i in range(runs):
+
+		T1 = time()
+		out = subprocess.run([sys.executable, "-c", script], capture_output=True, text=True, check=True, cwd=dirname(abspath(__file__)))
+		times.append(float(out.stdout) - T1)
+
+	times.sort()
+
+	return { "runs" : runs, "min" : times[0], "median" : times[len(times) // 2] }
+
+def summarise(results):
+
+	solved = [ r for r in results.values() if r["guesses"] is not None ]
+
+	return {
+		"targets" : len(results),
+		"solved" : len(solved),
+		"total_guesses" : sum( len(r["guesses"]) for r in solved ),
+		"max_guesses" : max(( len(r["guesses"]) for r in solved ), default=0),
+		"time" : sum( r["time"] for r in results.values() ),
+		"evaluations" : sum( r["evaluations"] for r in results.values() ),
+		"pruned" : sum( r["pruned"] for r in results.values() ),
+		"equivalent" : sum( r.get("equivalent", 0) for r in results.values() ),
+		"memory_growth" : max(( r["memory_growth"] for r in results.values() ), default=0),
+		"peak_memory" : max(( r["process_peak_memory"] for r in results.values() ), default=0),
+	}
+
+def run(methods, targets, width, jobs, location, startup_runs=10):
+
+	global solver
+
+	P = Pyrdle(location)
+
+	if targets is None:
+		targets = P.secret_words
+
+	for target in targets:
+		if target not in P.secret_index:
+			raise ValueError(f"Target word {target} is not in the list of secret words")
+
+	tasks = [ (method, target, width) for method in methods for target in targets ]
+	results = { method : {} for method in methods }
+
+	startup = measure_startup(location, startup_runs) if startup_runs else None
+
+	T1 = perf_counter()
+
+	if jobs == 1:
+		solver = P
+		outcomes = map(run_target, tasks)
+	else:
+		workers = Pool(jobs, initializer=init_solver, initargs=(location,))
+		outcomes = workers.imap_unordered(run_target, tasks)
+
+	for done, (method, target, result) in enumerate(outcomes, 1):
+
+		results[method][target] = result
+		print(f"\r{done}/{len(tasks)} solved", end="", file=sys.stderr, flush=True)
+
+	print("", file=sys.stderr)
+
+	if jobs != 1:
+		workers.close()
+		workers.join()
+
+	T2 = perf_counter()
+
+	return {
+		"version" : 1,
+		"fingerprint" : P.matrix.digest.hex(),
+		"width" : width,
+		"jobs" : jobs,
+		"book" : len(P.book) > 0,
+		"wall_time" : T2 - T1,
+		"startup" : startup,
+		"summary" : { method : summarise(results[method]) for method in methods },
+		"results" : { method : dict(sorted(results[method].items())) for method in methods },
+	}
+
+# Differences between a report and a baseline that count as regressions: a
+# target needing more guesses (or going unsolved), or a solver's total time,
+# match evaluations or peak memory growing by more than the tolerance.
+def compare(report, baseline, tolerance):
+
+	if report["fingerprint"] != baseline["fingerprint"]:
+		return ["The baseline was recorded for a different word list."]
+
+	if report["width"] != baseline["width"]:
+		return [f"The baseline was recorded with a pruning width of {baseline['width']}, not {report['width']}."]
+
+	regressions = []
+
+	if report.get("startup") and baseline.get("startup"):
+
+		new = report["startup"]["median"]
+		old = baseline["startup"]["median"]
+
+		if new > old * (1 + tolerance):
+			regressions.append(f"startup went from {1000 * old:.1f}ms to {1000 * new:.1f}ms.")
+
+	for method in report["results"]:
+
+		if method not in baseline["results"]:
+			continue
+
+		for target, result in report["results"][method].items():
+
+			if target not in baseline["results"][method]:
+				continue
+
+			old = baseline["results"][method][target]["guesses"]
+			new = result["guesses"]
+
+			if (new is None) and (old is not None):
+				regressions.append(f"{method}: {target} is no longer solved (baseline: {len(old)} guesses).")
+
+			elif (new is not None) and (old is not None) and (len(new) > len(old)):
+				regressions.append(f"{method}: {target} takes {len(new)} guesses (baseline: {len(old)}).")
+
+		# Totals are only comparable over the same targets.
+		if report["results"][method].keys() != baseline["results"][method].keys():
+			continue
+
+		new = report["summary"][method]
+		old = baseline["summary"][method]
+
+		for measure, unit in (("time", "s"), ("evaluations", ""), ("peak_memory", "KB")):
+
+			if new[measure] > old[measure] * (1 + tolerance):
+				regressions.append(f"{method}: {measure} went from {old[measure]:.6g}{unit} to {new[measure]:.6g}{unit}.")
+
+	return regressions
+
+# Plays random scripted games against Absurdle: a batch at a time through
+# simulate, then one game at a time through adversarial_step, checking that
+# every response and pool agrees. Reports game-steps per second for both.
+def run_simulation(location, games, steps=6, batch_size=1024, seed=0):
+
+	P = Pyrdle(location)
+	random = Random(seed)
+
+	scripts = [ [ random.randrange(len(P.possible_words)) for s in range(steps) ] for i in range(games) ]
+	full = P.candidates.bits
+
+	T1 = perf_counter()
+
+	batched = []
+
+	for start in range(0, games, batch_size):
+
+		batch = scripts[start : start + batch_size]
+		states = [full] * len(batch)
+		moves = []
+
+		for s in range(steps):
+			codes, states = P.simulate(states, [ script[s] for script in batch ])
+			moves.append(list(zip(codes, states)))
+
+		batched += zip(*moves)
+
+	T2 = perf_counter()
+
+	mismatches = 0
+
+	for script, moves in zip(scripts, batched):
+
+		pool = P.candidates
+
+		for g, move in zip(script, moves):
+
+			code, pool = P.adversarial_step(pool, P.possible_words[g])
+
+			if (code, pool.bits) != move:
+				mismatches += 1
+
+	T3 = perf_counter()
+
+	return {
+		"games" : games,
+		"steps" : steps,
+		"batch_size" : batch_size,
+		"batched" : { "time" : T2 - T1, "steps_per_second" : (games * steps) / (T2 - T1) },
+		"single" : { "time" : T3 - T2, "steps_per_second" : (games * steps) / (T3 - T2) },
+		"mismatches" : mismatches,
+	}
+
+# Checks the exact solver's claims, for the standard game and each target:
+# that its solution really wins (replayed against Absurdle one step at a
+# time), that its certificate refutes every budget from the lower bound up
+# to the solution's length, and that the greedy solver does no better.
+def run_exact_check(location, targets):
+
+	P = Pyrdle(location)
+	win = len(P.responses) - 1
+
+	for target in targets:
+		if target not in P.secret_index:
+			raise ValueError(f"Target word {target} is not in the list of secret words")
+
+	results = {}
+
+	for target in (None,) + tuple(targets):
+
+		T1 = perf_counter()
+		solution, certificate = P.exact_search(target)
+		T2 = perf_counter()
+
+		problems = []
+
+		if solution is None:
+			problems.append("no solution was found.")
+
+		else:
+
+			P.reset()
+			pool = P.candidates
+
+			for word in solution:
+				code, pool = P.adversarial_step(pool, word)
+
+			if code != win:
+				problems.append(f"the solution ends with {word}, which Absurdle answers with {P.responses[code]}.")
+
+			if (target is not None) and (solution[-1] != target):
+				problems.append(f"the solution ends with {solution[-1]}, not the target.")
+
+			if certificate["optimal"] != len(solution):
+				problems.append(f"the certificate claims {certificate['optimal']} guesses, but the solution has {len(solution)}.")
+
+			if certificate["lower_bound"] != P.guesses_lower_bound(len(P.secret_words)):
+				problems.append(f"the certificate's lower bound of {certificate['lower_bound']} is wrong.")
+
+			if sorted(certificate["refuted"]) != list(range(certificate["lower_bound"], len(solution))):
+				problems.append(f"the certificate refutes budgets {sorted(certificate['refuted'])}, not every one from {certificate['lower_bound']} to {len(solution) - 1}.")
+
+			with redirect_stdout(StringIO()):
+				greedy = P.greedy_search(hardmode=target)
+
+			if (greedy is not None) and (len(greedy) < len(solution)):
+				problems.append(f"the greedy solver wins in {len(greedy)} guesses: {', '.join(greedy)}.")
+
+		results[target or "standard"] = {
+			"guesses" : solution,
+			"certificate" : certificate,
+			"time" : T2 - T1,
+			"problems" : problems,
+		}
+
+	return {
+		"fingerprint" : P.matrix.digest.hex(),
+		"results" : results,
+	}
+
+def print_exact_check(report):
+
+	failed = 0
+
+	for name, result in report["results"].items():
+
+		if result["problems"]:
+
+			failed += 1
+			print(f"{name}: FAILED after {result['time']:.3f}s")
+
+			for problem in result["problems"]:
+				print(f" - {problem}")
+
+		else:
+			print(f"{name}: {', '.join(result['guesses'])} is optimal ({len(result['guesses'])} guesses, {result['time']:.3f}s)")
+
+	if failed:
+		print(f"{failed} of {len(report['results'])} checks failed!")
+	else:
+		print("Every solution and certificate checked out.")
+
+def print_simulation(report):
+
+	n = report["games"] * report["steps"]
+
+	print(f"Simulated {report['games']} games of {report['steps']} random guesses ({n} game-steps).")
+	print(f"Batches of {report['batch_size']}: {report['batched']['time']:.3f}s, {report['batched']['steps_per_second']:.0f} game-steps/s.")
+	print(f"One at a time: {report['single']['time']:.3f}s, {report['single']['steps_per_second']:.0f} game-steps/s.")
+
+	if report["mismatches"]:
+		print(f"{report['mismatches']} steps gave different responses in batches!")
+	else:
+		print("Every response matched.")
+
+def print_summary(report):
+
+	for method, summary in report["summary"].items():
+
+		average = summary["total_guesses"] / summary["solved"] if summary["solved"] else 0
+
+		print(f"{method}: solved {summary['solved']}/{summary['targets']} targets, {average:.4f} guesses on average, {summary['max_guesses']} at worst.")
+		print(f"{' ' * len(method)}  {summary['time']:.3f}s solving, {summary['evaluations'] + summary['pruned']} guesses evaluated ({summary['pruned']} abandoned early, {summary['equivalent']} more skipped as equivalent), peak memory {summary['peak_memory']}KB (at most {summary['memory_growth']}KB more for one target).")
+
+	if report["startup"] is not None:
+		print(f"Startup: {1000 * report['startup']['median']:.1f}ms to the first response (median of {report['startup']['runs']} runs, best {1000 * report['startup']['min']:.1f}ms).")
+
+	print(f"Wall time: {report['wall_time']:.3f}s")
+
+if __name__ == "__main__":
+
+	parser = argparse.ArgumentParser(description="Solve Absurdle's challenge mode for every target word, and compare the results against a baseline.")
+	parser.add_argument("targets", nargs="*", metavar="target", type=str, help="Target words to solve for. Defaults to every secret word.")
+	parser.add_argument("--solver", default=None, required=False, choices=solvers, help="Only benchmark one solver. Both are run if not set.")
+	parser.add_argument("-n", default=6, required=False, type=int, help="Branch pruning width. Defaults to 6 if not set, to keep full runs manageable.")
+	parser.add_argument("-j", default=1, required=False, type=int, help="Number of targets to solve in parallel. Defaults to 1 if not set.")
+	parser.add_argument("-o", default=None, required=False, type=str, help="Save the report (as JSON) to this file.")
+	parser.add_argument("--baseline", default=None, required=False, type=str, help="Compare the results against this report, and fail on any regression.")
+	parser.add_argument("--tolerance", default=0.25, required=False, type=float, help="How much slower (or hungrier) than the baseline a run can be, as a fraction. Defaults to 0.25 if not set.")
+	parser.add_argument("--startup-runs", default=10, required=False, type=int, help="Number of times to time startup (from process launch to the first response). Defaults to 10 if not set; 0 skips it.")
+	parser.add_argument("--startup-only", default=False, required=False, action="store_true", help="Only time startup, without solving anything.")
+	parser.add_argument("--simulate", default=None, required=False, type=int, metavar="GAMES", help="Instead of solving, measure the throughput of simulating this many random games against Absurdle, in batches and one at a time.")
+	parser.add_argument("--steps", default=6, required=False, type=int, help="Guesses per simulated game. Defaults to 6 if not set.")
+	parser.add_argument("--batch-size", default=1024, required=False, type=int, help="Simulated games per batch. Defaults to 1024 if not set.")
+	parser.add_argument("--check-exact", default=False, required=False, action="store_true", help="Instead of benchmarking, check the exact solver's solutions and certificates for the standard game and the given targets (or " + ", ".join(exact_targets) + " if none are given). Quick enough to run in CI.")
+	parser.add_argument("--words", default=Pyrdle.default_file, required=False, type=str, help="Word list to use.")
+
+	args = parser.parse_args()
+
+	if args.check_exact:
+
+		report = run_exact_check(args.words, [ t.upper() for t in args.targets ] or exact_targets)
+
+		print_exact_check(report)
+
+		if args.o is not None:
+			with open(args.o, "w") as f:
+				JSON.dump(report, f, indent=1)
+
+		sys.exit(1 if any( r["problems"] for r in report["results"].values() ) else 0)
+
+	if args.simulate is not None:
+
+		report = run_simulation(args.words, args.simulate, args.steps, max(1, args.batch_size))
+
+		print_simulation(report)
+
+		if args.o is not None:
+			with open(args.o, "w") as f:
+				JSON.dump(report, f, indent=1)
+
+		sys.exit(1 if report["mismatches"] else 0)
+
+	if args.startup_only:
+		methods = ()
+	else:
+		methods = solvers if (args.solver is None) else (args.solver,)
+	targets = [ t.upper() for t in args.targets ] or None
+
+	report = run(methods, targets, args.n, max(1, args.j), args.words, args.startup_runs)
+
+	print_summary(report)
+
+	if args.o is not None:
+		with open(args.o, "w") as f:
+			JSON.dump(report, f, indent=1)
+
+	if args.baseline is not None:
+
+		with open(args.baseline, "r") as f:
+			baseline = JSON.load(f)
+
+		if baseline.get("book") != report["book"]:
+			print("Warning: the opening book was used in one run but not the other, so timings may not be comparable.")
+
+		# Solving in parallel slows each target down, and spreads memory use
+		# over more processes.
+		if baseline.get("jobs") != report["jobs"]:
+			print(f"Warning: the baseline was run with {baseline.get('jobs')} parallel jobs, not {report['jobs']}, so timings and peak memory may not be comparable.")
+
+		regressions = compare(report, baseline, args.tolerance)
+
+		if regressions:
+
+			print(f"\n{len(regressions)} regression(s) against {args.baseline}:")
+			for r in regressions:
+				print(f" - {r}")
+
+			sys.exit(1)
+
+		print(f"\nNo regressions against {args.baseline}.")
@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+
+from hashlib import sha1
+from os.path import exists
+
+from pyrdle_files import atomic_write
+
+# Precomputed opening moves, saved next to the word list. Entries are keyed
+# by a mode (the challenge mode target, "" for normal mode, or a solver
+# name) and a pool, and hold whatever the solver for that mode needs. The
+# whole book is tied to the word lists' fingerprint, and ignored if they
+# change.
+class OpeningBook(object):
+
+	version = 1
+
+	def __init__(self, location, digest):
+
+		self.location = location
+		self.digest = digest.hex()
+		self.entries = None
+
+	@staticmethod
+	def key(bits, mode=None):
+
+		h = sha1(bits.to_bytes((bits.bit_length() + 7) // 8, "little"))
+
+		return f"{mode or ''}:{h.hexdigest()}"
+
+	# The book is only read the first time it's needed.
+	def load(self):
+
+		self.entries = {}
+
+		if not exists(self.location):
+			return
+
+		# Imported here rather than up top, to keep startup quick.
+		import json as JSON
+
+		try:
+			with open(self.location, "r") as f:
+				book = JSON.load(f)
+
+		except (OSError, ValueError):
+			return
+
+		if (book.get("version") == self.version) and (book.get("fingerprint") == self.digest):
+			self.entries = book["entries"]
+
+	def get(self, bits, mode=None):
+
+		if self.entries is None:
+			self.load()
+
+		return self.entries.get(self.key(bits, mode))
+
+	def put(self, bits, mode, entry):
+
+		if self.entries is None:
+			self.load()
+
+		self.entries[self.key(bits, mode)] = entry
+
+	def __len__(self):
+
+		if self.entries is None:
+			self.load()
+
+		return len(self.entries)
+
+	def save(self):
+
+		import json as JSON
+
+		book = { "version" : self.version, "fingerprint" : self.digest, "entries" : self.entries or {} }
+
+		with atomic_write(self.location, "w") as f:
+			JSON.dump(book, f, separators=(",", ":"))
@@ -0,0 +1,41 @@
+#!/usr/bin/env python3
+
+from collections import OrderedDict
+
+# A bounded memo of search results, keyed by candidate pool, with
+# least-recently-used eviction.
+class TranspositionTable(object):
+
+	def __init__(self, maxsize=4096):
+
+		self.maxsize = maxsize
+		self.entries = OrderedDict()
+
+		self.hits = 0
+		self.misses = 0
+
+	def __len__(self):
+		return len(self.entries)
+
+	def get(self, key):
+
+		if key not in self.entries:
+			self.misses += 1
+			return None
+
+		self.hits += 1
+		self.entries.move_to_end(key)
+
+		return self.entries[key]
+
+	def put(self, key, value):
+
+		self.entries[key] = value
+		self.entries.move_to_end(key)
+
+		while len(self.entries) > self.maxsize:
+			self.entries.popitem(last=False)
+
+	def clear(self):
+
+		self.entries.clear()
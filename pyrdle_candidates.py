@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+
+from itertools import compress
+
+# Translates "0" and "1" characters to 0 and 1 bytes.
+flag_bytes = bytes.maketrans(b"01", b"\0\1")
+
+# Lists of the positions in word lists of each length, for compress to pick
+# indices from: reusing one saves making a new integer for every word.
+positions = {}
+
+# Indices of the set bits of an integer, lowest first, generated lazily.
+def iter_bits(bits):
+
+	while bits:
+
+		low = bits & -bits
+		yield low.bit_length() - 1
+
+		bits ^= low
+
+# An immutable set of secret words, stored as a bitset over their indices in
+# the (shared) secret word list. Bit i is set if secret_words[i] is in the set.
+class CandidateSet(object):
+
+	__slots__ = ("words", "index", "bits", "cached_indices")
+
+	def __init__(self, words, index, bits):
+
+		self.words = words
+		self.index = index
+		self.bits = bits
+		self.cached_indices = None
+
+	@classmethod
+	def full(cls, words, index):
+
+		return cls(words, index, (1 << len(words)) - 1)
+
+	@classmethod
+	def from_indices(cls, words, index, indices):
+
+		bitmap = bytearray((len(words) + 7) // 8)
+
+		for i in indices:
+			bitmap[i >> 3] |= 1 << (i & 7)
+
+		return cls(words, index, int.from_bytes(bitmap, "little"))
+
+	@classmethod
+	def from_words(cls, words, index, members):
+
+		return cls.from_indices(words, index, ( index[w] for w in members ))
+
+	def with_bits(self, bits):
+
+		return CandidateSet(self.words, self.index, bits)
+
+	# Indices of the words in the set, in ascending order.
+	def indices(self):
+
+		if self.cached_indices is None:
+
+			# Big sets are quicker to read off in one go.
+			if len(self) * 8 > len(self.words):
+
+				n = len(self.words)
+
+				if n not in positions:
+					positions[n] = list(range(n))
+
+				self.cached_indices = list(compress(positions[n], self.membership()))
+				return self.cached_indices
+
+			# Reading the binary string backwards puts bit i at position i.
+			s = bin(self.bits)[:1:-1]
+			indices = []
+
+			i = s.find("1")
+			while i >= 0:
+				indices.append(i)
+				i = s.find("1", i + 1)
+
+			self.cached_indices = indices
+
+		return self.cached_indices
+
+	# One byte per word in the shared list: 1 if it's in the set, 0 if not.
+	# For picking the set's entries out of a sequence with compress.
+	def membership(self):
+
+		return bin(self.bits)[:1:-1].ljust(len(self.words), "0").encode().translate(flag_bytes)
+
+	def __len__(self):
+		return self.bits.bit_count()
+
+	def __iter__(self):
+		return ( self.words[i] for i in self.indices() )
+
+	def __contains__(self, item):
+
+		if isinstance(item, str):
+
+			if item not in self.index:
+				return False
+
+			item = self.index[item]
+
+		return (self.bits >> item) & 1 == 1
+
+	def __and__(self, other):
+		return self.with_bits(self.bits & other.bits)
+
+	def __or__(self, other):
+		return self.with_bits(self.bits | other.bits)
+
+	def __sub__(self, other):
+		return self.with_bits(self.bits & ~other.bits)
+
+	def __eq__(self, other):
+		return isinstance(other, CandidateSet) and (self.bits == other.bits)
+
+	def __hash__(self):
+		return hash(self.bits)
+
+	def __repr__(self):
+		return f"CandidateSet({list(self)})"
@@ -1,20 +1,55 @@
 #!/usr/bin/env python3
 
-import json as JSON
-from os.path import exists
-from math import log
+from array import array
+from os.path import exists, splitext
 from datetime import date
-from time import mktime
+from time import mktime, perf_counter
+from collections import Counter
+from contextlib import nullcontext
+from heapq import heappush, heapreplace, merge, nsmallest
+from itertools import chain, product
+
+from pyrdle_book import OpeningBook
+from pyrdle_cache import TranspositionTable
+from pyrdle_candidates import CandidateSet, iter_bits
+from pyrdle_kernel import EncodedWords, bincount, code_size, matching_bits, selector
+from pyrdle_matrix import ComputedResponses, ResponseMatrix
+from pyrdle_stats import Stats
+from pyrdle_store import WordStore
 
 class Pyrdle(object):
 
 	default_file = "./words.dat"
+	transposition_size = 4096
+
+	# Steps remembered by simulate.
+	simulation_size = 65536
+
+	# simulate reads pools this small a word at a time, and builds a guess's
+	# bitset for each response once the pools it's played from hold this
+	# many times as many words as there are secret words.
+	simulation_scan_size = 32
+	simulation_bitset_share = 2
+
+	# Number of ranked guesses kept per opening book entry.
+	book_width = 20
+
+	# Pools smaller than this are always partitioned in full.
+	bounded_min_pool = 64
+
+	# Guesses looked at per step when finishing off a search that ran out
+	# of time.
+	completion_guesses = 128
+
+	# Largest response matrix (in bytes) to build and keep on disk. Bigger
+	# word lists have their responses worked out as they're needed.
+	matrix_limit = 1 << 30
 
 	W = 0
 	Y = 1
 	G = 2
 
-	def __init__(self, loc=None):
+	def __init__(self, loc=None, jobs=1, bounded=True, stats=False):
 
 		if loc is None:
 			location = self.default_file
@@ -27,37 +62,117 @@ class Pyrdle(object):
 		else:
 			raise IOError(f"No wordlist found at {location}")
 
-		# Pre-build responses map.
-		responses = [""]
-		
-		for pos in range(5):
-			
-			new_responses = []
-			
-			for stub in responses:
-				for option in [str(self.W), str(self.Y), str(self.G)]:
-					new_responses.append(stub + option)
+		# Response strings, indexed by their base-3 response code.
+		self.responses = self.response_strings(self.word_length)
+
+		# Scores of each response, worked out when first needed.
+		self.response_scores = None
+
+		# Absurdle breaks ties between equally-sized buckets by picking the
+		# lowest-scoring response. The ranks are kept in the word store.
+		self.response_rank = self.store.ranks
+
+		self.guess_index = { w : i for i, w in enumerate(self.possible_words) }
+		self.guess_letters = None
+		self.secret_index = { w : i for i, w in enumerate(self.secret_words) }
+
+		# Codes for words of more than five letters take two bytes, and are
+		# packed into tuples rather than bytes.
+		size = code_size(self.word_length)
+		self.pack_codes = bytes if (size == 1) else tuple
 
-			responses = new_responses
+		if ResponseMatrix.size(len(self.possible_words), len(self.secret_words), size) <= self.matrix_limit:
+			self.matrix = ResponseMatrix(self.possible_words, self.secret_words, splitext(location)[0] + ".responses", self.store.digest, size)
+		else:
+			self.matrix = ComputedResponses(self.possible_words, self.secret_words, self.store.digest, size)
+
+		self.encoded = None
+
+		# Worker processes are started on first use. Each one opens the same
+		# word list and memory-maps the same response matrix, so the table
+		# is shared through the page cache rather than pickled to workers.
+		self.location = location
+		self.jobs = max(1, jobs)
+		self.workers = None
+
+		# Branch-and-bound guess evaluation, and how much of it was saved.
+		self.bounded = bounded
+		self.evaluations = 0
+		self.pruned = 0
+
+		# Guesses skipped for splitting the pool just like another guess.
+		self.guess_string = None
+		self.equivalent = 0
+
+		# Instrumentation, if asked for.
+		self.stats = Stats() if stats else None
+
+		# Exact solver state: pools refuted for a given number of guesses.
+		self.distinct_responses = None
+		self.exact_failures = {}
+		self.target_table_cache = {}
+		self.exact_cut = False
 
-		self.response_scores = { r : self.calculate_result_score(r) for r in responses }
+		# Top-n results, keyed by (pool fingerprint, hardmode).
+		self.transpositions = TranspositionTable(self.transposition_size)
+
+		# simulate's results, keyed by (pool bitset, guess index).
+		self.simulations = TranspositionTable(self.simulation_size)
+
+		# Precomputed openings, if the book has been built for this word list.
+		self.book = OpeningBook(splitext(location)[0] + ".book", self.matrix.digest)
 
 		self.reset()
 
+	def response_strings(self, length):
+
+		return [ "".join(r) for r in product((str(self.W), str(self.Y), str(self.G)), repeat=length) ]
+
 	def calculate_result_score(self, result):
 
 		as_nums = [ int(x) for x in result ]
+		L = len(as_nums)
 		
 		score = 0
-		for i in range(5):
+		for i in range(L):
 
 			current_value = as_nums[i]
-			score += pow(10, (5+current_value))  +  (current_value * pow(10, (5-i-1)))
+			score += pow(10, (L+current_value))  +  (current_value * pow(10, (L-i-1)))
 
 		return score
 
-	def score_response(self, response):
-		return self.response_scores[response]
+	def result_score(self, result):
+
+		if self.response_scores is None:
+			self.response_scores = { r : self.calculate_result_score(r) for r in self.responses }
+
+		return self.response_scores[result]
+
+	# Response codes for words of the given length, ranked by score:
+	# rank_responses(length)[code] is the rank of that code, lowest score
+	# first.
+	def rank_responses(self, length):
+
+		responses = self.response_strings(length)
+		ranked = sorted(range(len(responses)), key=lambda code : self.calculate_result_score(responses[code]))
+
+		ranks = [0] * len(responses)
+		for rank, code in enumerate(ranked):
+			ranks[code] = rank
+
+		return ranks
+
+	# A context manager timing its block, if instrumentation is on.
+	def timed(self, name):
+
+		if self.stats is None:
+			return nullcontext()
+
+		return self.stats.timer(name)
+
+	# Tie-break rank of a response code (lower ranks win ties).
+	def score_response(self, code):
+		return self.response_rank[code]
 
 	def response_to_emoji(self, result):
 		
@@ -78,109 +193,266 @@ class Pyrdle(object):
 
 	def read_from_file(self,inf=None):
 
-		with open(inf, "r") as f:
-
-			l = f.readlines()
+		# The words are loaded from a compiled copy of the word list, which
+		# is built next to it the first time round.
+		self.store = WordStore(inf, splitext(inf)[0] + ".store", self.rank_responses)
 
-		self.secret_words = l[0].split(",")
-		self.possible_words = l[1].split(",") + self.secret_words
+		self.secret_words = self.store.secret_words
+		self.possible_words = self.store.possible_words
+		self.wordle_answers = self.store.wordle_answers
+		self.word_length = self.store.word_length
 
 	def reset(self):
 
-		self.candidates = self.secret_words
+		self.candidates = CandidateSet.full(self.secret_words, self.secret_index)
 
+	# A pool as a CandidateSet. Pools can also be given as lists of words.
+	def candidate_set(self, pool=None):
 
-	# This be what absurdle do.
-	def find_adversarial_match(self,matches):
+		if pool is None:
+			return self.candidates
+
+		if isinstance(pool, CandidateSet):
+			return pool
+
+		return CandidateSet.from_words(self.secret_words, self.secret_index, pool)
+
+	# Secret word indices of a pool (by default, the current candidates).
+	def pool_indices(self, pool=None):
+
+		return self.candidate_set(pool).indices()
+
+	# A canonical key for a pool: a bitset over secret word indices.
+	def pool_fingerprint(self, pool=None):
+
+		return self.candidate_set(pool).bits
+
+	# The members of a pool whose response code is the given one.
+	def bucket(self, pool, codes, match):
+
+		return CandidateSet.from_indices(self.secret_words, self.secret_index, [ i for i, code in zip(pool.indices(), codes) if code == match ])
+
+	# Picks this pool's codes out of a row of the response matrix.
+	def selector(self, pool=None):
+
+		indices = self.pool_indices(pool)
+
+		if len(indices) == self.matrix.n_secrets:
+			return lambda row : row
+
+		return selector(indices)
+
+	# A function giving the response codes of a guess (by index) against
+	# every word in the pool. Without a stored matrix, the pool is encoded
+	# and only its own codes worked out.
+	def pool_feedback(self, pool):
+
+		if not self.matrix.stored:
+
+			encoded = EncodedWords([ self.secret_words[i] for i in pool.indices() ], self.matrix.code_size)
+			words = self.possible_words
 
-		biggest_key = None
-		biggest_set_size = -1
+			return lambda g : encoded.feedback(words[g])
 
-		for result in matches:
+		select = self.selector(pool)
+		row = self.matrix.row
 
-			set_size = len(matches[result])
+		return lambda g : select(row(g))
 
-			if set_size > biggest_set_size:
+	# Response codes of a guess against every secret word.
+	def feedback_row(self, guess):
 
-				biggest_key = result
-				biggest_set_size = set_size
+		if guess in self.guess_index:
+			return self.matrix.row(self.guess_index[guess])
 
-			elif set_size == biggest_set_size:
+		if self.encoded is None:
+			self.encoded = EncodedWords(self.secret_words, self.matrix.code_size)
 
-				if self.score_response(result) < self.score_response(biggest_key):
+		return self.encoded.feedback(guess)
 
-					biggest_key = result
-					biggest_set_size = set_size
+	# Response codes of a guess against every word in the pool.
+	def feedback(self, guess, pool=None):
 
-		return biggest_key
+		return self.pack_codes(self.selector(pool)(self.feedback_row(guess)))
+
+	# Bucket sizes (indexed by response code) for each of the guesses.
+	def partition_sizes(self, guesses=None, pool=None):
+
+		if guesses is None:
+			guesses = self.possible_words
+
+		select = self.selector(pool)
+
+		return [ bincount(select(self.feedback_row(guess)), len(self.responses)) for guess in guesses ]
+
+
+	# This be what absurdle do.
+	# Takes bucket sizes, either as a list indexed by response code or as a
+	# {code : size} dict, and returns the code of the bucket Absurdle picks.
+	def find_adversarial_match(self, sizes):
+
+		if not isinstance(sizes, dict):
+			sizes = { code : size for code, size in enumerate(sizes) if size }
+
+		biggest_set_size = max(sizes.values())
+		biggest_keys = [ code for code, size in sizes.items() if size == biggest_set_size ]
+
+		if len(biggest_keys) == 1:
+			return biggest_keys[0]
+
+		return min(biggest_keys, key=self.response_rank.__getitem__)
 
 
 	# This also be what absurdle do.
 	def adversarial_match(self, word):
 
-		if word not in self.possible_words:
+		if word not in self.guess_index:
 			return None
 
 		else:
-			matches = self.match_single(word)
+			biggest_key, self.candidates = self.adversarial_step(self.candidates, word)
 
-			biggest_key = self.find_adversarial_match(matches)
+			return self.responses[biggest_key]
 
-			self.candidates = matches[biggest_key]
-			return biggest_key
+	# One move of Absurdle, as a pure function of the pool and the guess:
+	# returns the response code Absurdle gives, and the pool left after it.
+	def adversarial_step(self, pool, word):
 
+		if self.stats is not None:
+			self.stats.count("adversarial_step")
 
+		pool = self.candidate_set(pool)
+		codes = self.feedback(word, pool)
 
-	# Make response pools for a single word.
-	def match_single(self, guess):
+		biggest_key = self.find_adversarial_match(Counter(codes))
+
+		return biggest_key, self.bucket(pool, codes, biggest_key)
+
+	# adversarial_step for many games at once. Each game is a pool bitset
+	# (as in CandidateSet.bits) and a guess (a word or a guess index), and
+	# the response codes Absurdle gives and the bitsets of the pools left
+	# are returned as two lists, in the same order. Games in the same state
+	# making the same guess are only worked out once, each distinct pool is
+	# only read once, and recent steps are remembered between calls.
+	def simulate(self, states, guesses):
+
+		if self.stats is not None:
+			self.stats.count("simulated_steps", len(states))
+
+		index = self.guess_index
+		guesses = [ g if isinstance(g, int) else index[g] for g in guesses ]
+
+		steps = {}
+		todo = {}
+
+		for bits, g in zip(states, guesses):
+
+			key = (bits, g)
+
+			if key in steps:
+				continue
+
+			step = self.simulations.get(key)
+
+			if step is None:
+				todo.setdefault(g, set()).add(bits)
+			else:
+				steps[key] = step
+
+		stored = self.matrix.stored
+		size = self.matrix.code_size
+		n = self.matrix.n_secrets
+
+		# Each pool's selector (or codes, without a stored matrix) is only
+		# worked out once, however many guesses are played from it.
+		readers = {}
 
-		matches = {}
+		for g, pools in todo.items():
 
-		keys = [""]
-		for i in range(5):
+			if not stored:
 
-			new_keys = []
+				for bits in pools:
 
-			for k in keys:
-				for c in [self.W, self.G, self.Y]:
-					new_keys.append(str(k) + str(c))
+					pool = self.candidates.with_bits(bits)
 
-			keys = new_keys
+					if bits not in readers:
+						readers[bits] = self.pool_feedback(pool)
 
+					codes = readers[bits](g)
+					code = self.find_adversarial_match(Counter(codes))
+					steps[(bits, g)] = (code, self.bucket(pool, codes, code).bits)
 
-		for k in keys:
-			matches[k] = []
+				continue
 
-		for word in self.candidates:
+			row = self.matrix.row(g)
 
-			v = [None] * 5
+			# A guess played from lots of words: pick out the words getting
+			# each response once, and size each pool's buckets by popcount.
+			if sum( bits.bit_count() for bits in pools ) >= self.simulation_bitset_share * n:
 
-			for i in range(5):
+				raw = bytes(row)
+				responses = { code : matching_bits(raw, code, size) for code in set(row) }
 
-				if guess[i] == word[i]:
-					v[i] = self.G
+				for bits in pools:
 
-				elif guess[i] not in word:
-					v[i] = self.W
+					sizes = {}
 
-			if None in v:
+					for code, words in responses.items():
 
-				for i in range(5):
+						bucket_size = (bits & words).bit_count()
 
-					if guess[i] in word:
-						if v[i] is None:
+						if bucket_size:
+							sizes[code] = bucket_size
 
-							matches_thus_far = [ v[j] for j in range(5) if (guess[j] == guess[i] and v[j] is not None) ]
-							num_in_candidate = word.count(guess[i])
+					code = self.find_adversarial_match(sizes)
+					steps[(bits, g)] = (code, bits & responses[code])
 
-							if len(matches_thus_far) < num_in_candidate:
-								v[i] = self.Y
-							else:
-								v[i] = self.W
+				continue
 
+			for bits in pools:
 
+				# Small pools are quicker to read a word at a time than to
+				# pick out of the whole row.
+				if bits.bit_count() <= self.simulation_scan_size:
 
-			matches["".join( str(i) for i in v )].append(word)
+					members = list(iter_bits(bits))
+					codes = [ row[i] for i in members ]
+
+					code = self.find_adversarial_match(Counter(codes))
+					left = 0
+
+					for i, c in zip(members, codes):
+						if c == code:
+							left |= 1 << i
+
+					steps[(bits, g)] = (code, left)
+
+				else:
+
+					if bits not in readers:
+						readers[bits] = self.selector(self.candidates.with_bits(bits))
+
+					code = self.find_adversarial_match(Counter(readers[bits](row)))
+					steps[(bits, g)] = (code, matching_bits(bytes(row), code, size) & bits)
+
+		for g, pools in todo.items():
+			for bits in pools:
+				self.simulations.put((bits, g), steps[(bits, g)])
+
+		results = [ steps[(bits, g)] for bits, g in zip(states, guesses) ]
+
+		return [ code for code, bits in results ], [ bits for code, bits in results ]
+
+	# Make response pools for a single word.
+	def match_single(self, guess):
+
+		if self.stats is not None:
+			self.stats.count("match_single")
+
+		matches = { r : [] for r in self.responses }
+
+		for word, code in zip(self.candidates, self.feedback(guess)):
+			matches[self.responses[code]].append(word)
 
 		return matches
 
@@ -212,82 +484,470 @@ class Pyrdle(object):
 
 		while not solved:
 
+			if self.stats is not None:
+				snapshot = self.stats.snapshot(self)
+				size = len(self.candidates)
+
 			next_guess = self.greedy_search_single(hardmode)
 
+			# No guess keeps the target in play.
+			if next_guess is None:
+				return None
+
 			print(next_guess)
 			found.append(next_guess)
 
 			result = self.adversarial_match(next_guess)
 
-			solved = result == str(self.G) * 5
+			solved = result == str(self.G) * self.word_length
+
+			if self.stats is not None:
+				self.stats.level("greedy", snapshot, self, pools=1, smallest=size, largest=size, guess=next_guess, remaining=len(self.candidates))
 
 		return found
 
-	def greedy_search_single(self, hardmode=None):
+	# Guess indices in the order a bounded search should try them. Guesses
+	# using letters that are common in the pool tend to split it best, so
+	# trying them first finds tight cutoffs early.
+	def guess_order(self, pool, guesses):
 
-		best_word = None
-		best_set_size = None
-		best_score = None
+		if self.guess_letters is None:
+			self.guess_letters = [ tuple(set(w)) for w in self.possible_words ]
 
-		# See which guess reduces the set of possible (secret) words the most.
-		for guess in self.possible_words:
+		frequency = Counter(chain.from_iterable( set(w) for w in pool ))
+		letters = self.guess_letters
+
+		return sorted(guesses, key=lambda g : -sum( frequency[c] for c in letters[g] ))
+
+	# Groups guesses that split a pool in exactly the same way. A letter
+	# that no word in the pool contains is always grey, wherever it is in a
+	# guess, so guesses that read the same once those letters are blanked
+	# out are equivalent. Returns the first guess of each class, in order,
+	# and {first guess : rest of its class} for classes of more than one,
+	# or None if every letter is in play.
+	def guess_classes(self, pool, guesses):
+
+		masks = self.store.masks
+		offset = len(self.possible_words) - len(self.secret_words)
+
+		present = 0
+		for i in pool.indices():
+			present |= masks[offset + i]
 
-			matches = self.match_single(guess)
-			match = self.find_adversarial_match(matches)
+		absent = "".join( chr(65 + b) for b in range(26) if not (present >> b) & 1 )
+
+		if not absent:
+			return None
+
+		if self.guess_string is None:
+			self.guess_string = "".join(self.possible_words)
+
+		blanked = self.guess_string.translate(str.maketrans(absent, "." * len(absent)))
+		L = self.word_length
+		signatures = [ blanked[i : i + L] for i in range(0, len(blanked), L) ]
+
+		first = {}
+		members = {}
+
+		for g in guesses:
+
+			representative = first.setdefault(signatures[g], g)
+
+			if representative != g:
+				members.setdefault(representative, []).append(g)
+
+		return list(first.values()), members
+
+	# Adversarial bucket for each guess: (guess index, code, size, codes),
+	# where codes are the guess's response codes against the pool.
+	# If bound is given, bound[0] is a bucket size above which the caller no
+	# longer cares about a guess; guesses found to exceed it part-way through
+	# partitioning the pool are abandoned, and not yielded.
+	# Only one guess from each class of equivalent guesses is evaluated, and
+	# unless expand is False, the rest of the class is yielded alongside it.
+	def evaluate_guesses(self, hardmode=None, pool=None, guesses=None, bound=None, expand=True):
+
+		pool = self.candidate_set(pool)
+
+		if guesses is None:
+			guesses = range(len(self.possible_words))
+
+		if self.stats is not None:
+			self.stats.count("partitioned_pools")
+
+		members = {}
+
+		with self.timed("guess_classes"):
+			classes = self.guess_classes(pool, guesses)
+
+		if classes is not None:
+
+			count = len(guesses)
+			guesses, members = classes
+
+			self.equivalent += count - len(guesses)
+
+		pool_codes = self.pool_feedback(pool)
+		rank = self.response_rank
+
+		if hardmode is not None:
+
+			if hardmode not in self.secret_index or hardmode not in pool:
+				return
+
+			# The target's position in the pool.
+			target = (pool.bits & ((1 << self.secret_index[hardmode]) - 1)).bit_count()
+
+		# Partial bucket sizes are lower bounds on the final ones, so check
+		# them against the cutoff after an eighth, a quarter and half of the
+		# pool has been partitioned.
+		pool_size = len(pool)
+		checkpoints = (pool_size >> 3, pool_size >> 2, pool_size >> 1) if (bound is not None) and (pool_size >= self.bounded_min_pool) else ()
+
+		if checkpoints:
+			guesses = self.guess_order(pool, guesses)
+
+		for g in guesses:
+
+			codes = pool_codes(g)
+
+			if checkpoints and (bound[0] is not None):
+
+				sizes = Counter()
+				start = 0
+				abandoned = False
+
+				for stop in checkpoints:
+
+					sizes.update(codes[start:stop])
+					start = stop
+
+					if max(sizes.values()) > bound[0]:
+						abandoned = True
+						break
+
+				if abandoned:
+					self.pruned += 1
+					continue
+
+				sizes.update(codes[start:])
+
+			else:
+				sizes = Counter(codes)
+
+			self.evaluations += 1
+
+			set_size = max(sizes.values())
+			biggest_keys = [ code for code, size in sizes.items() if size == set_size ]
+
+			if len(biggest_keys) == 1:
+				match = biggest_keys[0]
+			else:
+				match = min(biggest_keys, key=rank.__getitem__)
 
 			#If the set chosen by Absurdle doesn't contain the hardmode word,
 			#don't bother with this guess.
-			if hardmode is not None:
-				if hardmode not in matches[match]:
-					continue
+			if (hardmode is not None) and (codes[target] != match):
+				continue
+
+			yield (g, match, set_size, codes)
+
+			if expand and (g in members):
+				for m in members[g]:
+					yield (m, match, set_size, codes)
+
+	# The best guess of a shard, as a (size, -rank, guess index) key: smaller
+	# buckets win, then higher-scoring responses, then earlier guesses.
+	def shard_single(self, hardmode, pool, guesses):
+
+		rank = self.response_rank
+
+		best = None
+		bound = [None] if self.bounded else None
+
+		for g, match, set_size, codes in self.evaluate_guesses(hardmode, pool, guesses, bound):
+
+			key = (set_size, -rank[match], g)
+
+			if (best is None) or (key < best):
+
+				best = key
+
+				if bound is not None:
+					bound[0] = set_size
 
-			set_size = len(matches[match])
-			score = self.score_response(match)
+		return best
 
-			if (best_set_size is None) or (set_size < best_set_size) or ((set_size == best_set_size) and (score > best_score)):
+	# The n best guesses of a shard, as (size, rank, guess index, code), or
+	# None if the deadline (a perf_counter time, which is system-wide, so
+	# workers can check it too) passed before every guess was evaluated.
+	def shard_top_n(self, n, hardmode, deadline, pool, guesses):
 
-				best_word = guess
-				best_set_size = set_size
-				best_score = score
+		rank = self.response_rank
 
-		return best_word
+		# Max-heap (by negated key) of the best n guesses so far.
+		heap = []
+		bound = [None] if self.bounded else None
+
+		for g, match, set_size, codes in self.evaluate_guesses(hardmode, pool, guesses, bound):
+
+			if (deadline is not None) and (perf_counter() >= deadline):
+				return None
+
+			item = (-set_size, -rank[match], -g, match)
+
+			if len(heap) < n:
+				heappush(heap, item)
+
+			elif item > heap[0]:
+				heapreplace(heap, item)
+
+			else:
+				continue
+
+			if (bound is not None) and (len(heap) == n):
+				bound[0] = -heap[0][0]
+
+		return sorted( (-s, -r, -g, match) for s, r, g, match in heap )
+
+	# Every guess of a shard, as (size, rank, guess index, code), best first.
+	def shard_ranking(self, pool, guesses):
+
+		rank = self.response_rank
+
+		return sorted( (set_size, rank[match], g, match) for g, match, set_size, codes in self.evaluate_guesses(None, pool, guesses) )
+
+	def shards(self):
+
+		count = len(self.possible_words)
+		step = -(-count // (self.jobs * 4))
+
+		return [ range(start, min(start + step, count)) for start in range(0, count, step) ]
+
+	# Run a shard method over every shard of every pool, and return the
+	# shard results grouped by pool.
+	def map_shards(self, method, args, pools):
+
+		with self.timed(method):
+			return self.run_shards(method, args, pools)
+
+	def run_shards(self, method, args, pools):
+
+		if self.jobs == 1:
+			return [ [ getattr(self, method)(*args, pool, None) ] for pool in pools ]
+
+		if self.workers is None:
+
+			# Imported here, as most runs never need it.
+			from multiprocessing import Pool
+
+			self.workers = Pool(self.jobs, initializer=init_worker, initargs=(self.location, self.bounded))
+
+		shards = self.shards()
+
+		# Workers only ever see pool bitsets, never the words.
+		tasks = [ (method, args, self.pool_fingerprint(pool), shard) for pool in pools for shard in shards ]
+		results = []
+
+		for result, evaluations, pruned, equivalent in self.workers.map(run_shard, tasks):
+
+			results.append(result)
+			self.evaluations += evaluations
+			self.pruned += pruned
+			self.equivalent += equivalent
+
+		return [ results[i : i + len(shards)] for i in range(0, len(results), len(shards)) ]
+
+	def close(self):
+
+		if self.workers is not None:
+			self.workers.close()
+			self.workers.join()
+			self.workers = None
+
+	def greedy_search_single(self, hardmode=None):
+
+		entry = self.book.get(self.candidates.bits, hardmode)
+
+		if (entry is not None) and ("single" in entry):
+
+			if self.stats is not None:
+				self.stats.count("book_hits")
+
+			if entry["single"] is None:
+				return None
+
+			return self.possible_words[entry["single"][2]]
+
+		# See which guess reduces the set of possible (secret) words the most.
+		results = self.map_shards("shard_single", (hardmode,), [self.candidates])[0]
+		best = min(( r for r in results if r is not None ), default=None)
+
+		if best is None:
+			return None
+
+		return self.possible_words[best[2]]
 
 	def greedy_search_top_n(self, n, hardmode=None):
 
-		best_words = []
+		return self.greedy_search_top_n_pools(n, hardmode, [self.candidates])[0]
+
+	# The n best guesses for a (pool bits, hardmode) key from the opening
+	# book or an earlier search, or None if neither has them. A top-m list
+	# answers any n <= m, as does a list that came back shorter than m
+	# because there were no more guesses to rank.
+	def cached_top_n(self, key, n):
+
+		entry = self.book.get(*key)
+
+		if (entry is not None) and ("ranked" in entry):
+
+			entry = (entry["width"], [ tuple(unit) for unit in entry["ranked"] ])
+
+			if self.stats is not None:
+				self.stats.count("book_hits")
+
+		else:
+			entry = self.transpositions.get(key)
+
+		if (entry is not None) and ((entry[0] >= n) or (len(entry[1]) < entry[0])):
+			return entry[1][:n]
+
+		return None
+
+	# The n best guesses for each of the pools, as (size, rank, guess index,
+	# code), without the pools they leave. With a deadline, returns None if
+	# it passes before every pool has been searched.
+	def top_n_rankings(self, n, hardmode, pools, deadline=None):
+
+		keys = [ (pool.bits, hardmode) for pool in pools ]
+
+		ranked = {}
+
+		for key in keys:
+
+			entry = self.cached_top_n(key, n)
+
+			if entry is not None:
+				ranked[key] = entry
+
+		misses = {}
+
+		for key, pool in zip(keys, pools):
+			if key not in ranked:
+				misses.setdefault(key, pool)
+
+		if self.stats is not None:
+			self.stats.count("top_n_pools", len(pools))
+			self.stats.count("top_n_pools_searched", len(misses))
 
 		# See which guess reduces the set of possible (secret) words the most.
-		for guess in self.possible_words:
+		for key, results in zip(misses, self.map_shards("shard_top_n", (n, hardmode, deadline), list(misses.values()))):
 
-			matches = self.match_single(guess)
-			match = self.find_adversarial_match(matches)
-			
-			#If the set chosen by Absurdle doesn't contain the hardmode word,
-			#don't bother with this guess.
-			if hardmode is not None:
-				if hardmode not in matches[match]:
-					continue
+			# Searches cut short aren't kept.
+			if any( r is None for r in results ):
+				return None
+
+			ranked[key] = nsmallest(n, chain(*results))
+			self.transpositions.put(key, (n, ranked[key]))
+
+		return [ ranked[key] for key in keys ]
+
+	# greedy_search_top_n for several pools at once. With a deadline, returns
+	# None if it passes before every pool has been searched.
+	def greedy_search_top_n_pools(self, n, hardmode, pools, deadline=None):
+
+		pools = [ self.candidate_set(pool) for pool in pools ]
+		rankings = self.top_n_rankings(n, hardmode, pools, deadline)
+
+		if rankings is None:
+			return None
+
+		all_best_words = []
+
+		for pool, ranking in zip(pools, rankings):
+
+			if (deadline is not None) and (perf_counter() >= deadline):
+				return None
+
+			select = self.selector(pool)
+			best_words = []
+
+			for set_size, rank, g, match in ranking:
+
+				new_pool = self.bucket(pool, select(self.matrix.row(g)), match)
+
+				best_words.append((self.possible_words[g], set_size, rank, new_pool))
+
+			all_best_words.append(best_words)
 
-			set_size = len(matches[match])
-			score = self.score_response(match)
+		return all_best_words
 
-			unit = (guess, set_size, score, matches[match])
+	# Every guess for each of the pools, ranked as greedy_search_top_n would.
+	def rank_guesses(self, pools):
 
-			if len(best_words) < n:
+		return [ list(merge(*results)) for results in self.map_shards("shard_ranking", (), pools) ]
 
-				best_words.append(unit)
-				best_words.sort(key=lambda x : (x[1], x[2]))
+	# An opening book entry for a pool, given the ranking of every guess in
+	# it: the guess greedy_search_single would make, and the best few for
+	# greedy_search_top_n.
+	def book_entry(self, ranking, hardmode=None):
 
-			elif (set_size <= best_words[-1][1]):
+		# In challenge mode, only guesses leaving the target in play count.
+		if hardmode is not None:
+			codes = self.matrix.column(self.secret_index[hardmode])
+			ranking = [ unit for unit in ranking if codes[unit[2]] == unit[3] ]
 
-				best_words.append(unit)
-				best_words.sort(key=lambda x : (x[1], x[2]))
-				best_words.pop(-1)
+		# greedy_search_single breaks ties in favour of higher-ranked codes.
+		single = min(ranking, key=lambda unit : (unit[0], -unit[1], unit[2]), default=None)
 
+		return {
+			"single" : None if (single is None) else list(single),
+			"width" : self.book_width,
+			"ranked" : [ list(unit) for unit in ranking[:self.book_width] ],
+		}
 
-		return best_words
+	# Precomputes the first guesses for normal mode and for every challenge
+	# mode target, and the best guesses from the pools they leave: the
+	# pools after each of the top guesses in normal mode, and the pool after
+	# greedy_search_single's guess for each target.
+	def build_book(self):
 
-	def recurse_tree_with_pruning(self, hardmode=None, width=20):
+		root = CandidateSet.full(self.secret_words, self.secret_index)
+		ranking = self.rank_guesses([root])[0]
+
+		children = {}
+
+		for hardmode in [None] + self.secret_words:
+
+			entry = self.book_entry(ranking, hardmode)
+			self.book.put(root.bits, hardmode, entry)
+
+			units = entry["ranked"] if (hardmode is None) else []
+
+			if entry["single"] is not None:
+				units = units + [entry["single"]]
+
+			for set_size, rank, g, match in units:
+
+				pool = self.bucket(root, self.matrix.row(g), match)
+
+				if len(pool) > 1:
+					children.setdefault(pool.bits, (pool, set()))[1].add(hardmode)
+
+		child_pools = list(children.values())
+
+		for (pool, modes), ranking in zip(child_pools, self.rank_guesses([ pool for pool, modes in child_pools ])):
+			for hardmode in modes:
+				self.book.put(pool.bits, hardmode, self.book_entry(ranking, hardmode))
+
+		self.book.save()
+
+	# If deadline (a perf_counter time) passes, the search stops as soon as
+	# it can, and the best of the paths it had at the last level (as many
+	# as there are workers) are completed greedily, looking at only a few
+	# guesses per step so that it doesn't take long.
+	def recurse_tree_with_pruning(self, hardmode=None, width=20, deadline=None):
 
 		class Path(object):
 
@@ -296,12 +956,12 @@ class Pyrdle(object):
 				if path is None:
 
 					selfp.guesses = []
-					selfp.pool = self.secret_words[:]
+					selfp.pool = CandidateSet.full(self.secret_words, self.secret_index)
 
 				else:
 
 					selfp.guesses = path.guesses[:]
-					selfp.pool = path.pool[:]
+					selfp.pool = path.pool
 
 			def converged(self):
 
@@ -310,18 +970,26 @@ class Pyrdle(object):
 			def update(self, guess, new_pool):
 
 				self.guesses.append(guess)
-				self.pool = new_pool[:]
+				self.pool = new_pool
 
 		paths = [Path()]
 
 		while not any( path.converged() for path in paths ):
 
+			if self.stats is not None:
+				snapshot = self.stats.snapshot(self)
+				sizes = [ len(path.pool) for path in paths ]
+
 			new_paths = []
 
-			for path in paths:
+			pools = [ path.pool for path in paths ]
 
-				self.candidates = path.pool
-				best_words = self.greedy_search_top_n(width, hardmode)
+			all_best_words = self.greedy_search_top_n_pools(width, hardmode, pools, deadline)
+
+			if all_best_words is None:
+				return self.complete_greedily([ (path.guesses, path.pool) for path in paths[:self.jobs] ], hardmode, self.completion_guesses)
+
+			for path, best_words in zip(paths, all_best_words):
 
 				for unit in best_words:
 
@@ -330,24 +998,501 @@ class Pyrdle(object):
 
 					new_paths.append(new_path)
 
-			paths = new_paths
+			# Different guess sequences often leave the same pool, and those
+			# paths would expand identically, so only keep the first of them.
+			merged = {}
+
+			for path in new_paths:
+				merged.setdefault(path.pool.bits, path)
+
+			paths = list(merged.values())
 			paths.sort(key=lambda p : len(p.pool))
 			paths = paths[:width]
 
+			if self.stats is not None:
+				self.stats.level("pruning", snapshot, self, pools=len(sizes), smallest=min(sizes), largest=max(sizes), total=sum(sizes), children=len(new_paths), merged=len(new_paths) - len(merged), kept=len(paths))
+
+			if not paths:
+				return None
+
 		for i in paths:
 			if i.converged():
-			   return(i.guesses + i.pool)
+			   return(i.guesses + list(i.pool))
 
-	@staticmethod
-	def do_wordle():
-		
-		secret_words = ['CIGAR', 'REBUT', 'SISSY', 'HUMPH', 'AWAKE', 'BLUSH', 'FOCAL', 'EVADE', 'NAVAL', 'SERVE', 'HEATH', 'DWARF', 'MODEL', 'KARMA', 'STINK', 'GRADE', 'QUIET', 'BENCH', 'ABATE', 'FEIGN', 'MAJOR', 'DEATH', 'FRESH', 'CRUST', 'STOOL', 'COLON', 'ABASE', 'MARRY', 'REACT', 'BATTY', 'PRIDE', 'FLOSS', 'HELIX', 'CROAK', 'STAFF', 'PAPER', 'UNFED', 'WHELP', 'TRAWL', 'OUTDO', 'ADOBE', 'CRAZY', 'SOWER', 'REPAY', 'DIGIT', 'CRATE', 'CLUCK', 'SPIKE', 'MIMIC', 'POUND', 'MAXIM', 'LINEN', 'UNMET', 'FLESH', 'BOOBY', 'FORTH', 'FIRST', 'STAND', 'BELLY', 'IVORY', 'SEEDY', 'PRINT', 'YEARN', 'DRAIN', 'BRIBE', 'STOUT', 'PANEL', 'CRASS', 'FLUME', 'OFFAL', 'AGREE', 'ERROR', 'SWIRL', 'ARGUE', 'BLEED', 'DELTA', 'FLICK', 'TOTEM', 'WOOER', 'FRONT', 'SHRUB', 'PARRY', 'BIOME', 'LAPEL', 'START', 'GREET', 'GONER', 'GOLEM', 'LUSTY', 'LOOPY', 'ROUND', 'AUDIT', 'LYING', 'GAMMA', 'LABOR', 'ISLET', 'CIVIC', 'FORGE', 'CORNY', 'MOULT', 'BASIC', 'SALAD', 'AGATE', 'SPICY', 'SPRAY', 'ESSAY', 'FJORD', 'SPEND', 'KEBAB', 'GUILD', 'ABACK', 'MOTOR', 'ALONE', 'HATCH', 'HYPER', 'THUMB', 'DOWRY', 'OUGHT', 'BELCH', 'DUTCH', 'PILOT', 'TWEED', 'COMET', 'JAUNT', 'ENEMA', 'STEED', 'ABYSS', 'GROWL', 'FLING', 'DOZEN', 'BOOZY', 'ERODE', 'WORLD', 'GOUGE', 'CLICK', 'BRIAR', 'GREAT', 'ALTAR', 'PULPY', 'BLURT', 'COAST', 'DUCHY', 'GROIN', 'FIXER', 'GROUP', 'ROGUE', 'BADLY', 'SMART', 'PITHY', 'GAUDY', 'CHILL', 'HERON', 'VODKA', 'FINER', 'SURER', 'RADIO', 'ROUGE', 'PERCH', 'RETCH', 'WROTE', 'CLOCK', 'TILDE', 'STORE', 'PROVE', 'BRING', 'SOLVE', 'CHEAT', 'GRIME', 'EXULT', 'USHER', 'EPOCH', 'TRIAD', 'BREAK', 'RHINO', 'VIRAL', 'CONIC', 'MASSE', 'SONIC', 'VITAL', 'TRACE', 'USING', 'PEACH', 'CHAMP', 'BATON', 'BRAKE', 'PLUCK', 'CRAZE', 'GRIPE', 'WEARY', 'PICKY', 'ACUTE', 'FERRY', 'ASIDE', 'TAPIR', 'TROLL', 'UNIFY', 'REBUS', 'BOOST', 'TRUSS', 'SIEGE', 'TIGER', 'BANAL', 'SLUMP', 'CRANK', 'GORGE', 'QUERY', 'DRINK', 'FAVOR', 'ABBEY', 'TANGY', 'PANIC', 'SOLAR', 'SHIRE', 'PROXY', 'POINT', 'ROBOT', 'PRICK', 'WINCE', 'CRIMP', 'KNOLL', 'SUGAR', 'WHACK', 'MOUNT', 'PERKY', 'COULD', 'WRUNG', 'LIGHT', 'THOSE', 'MOIST', 'SHARD', 'PLEAT', 'ALOFT', 'SKILL', 'ELDER', 'FRAME', 'HUMOR', 'PAUSE', 'ULCER', 'ULTRA', 'ROBIN', 'CYNIC', 'AGORA', 'AROMA', 'CAULK', 'SHAKE', 'PUPAL', 'DODGE', 'SWILL', 'TACIT', 'OTHER', 'THORN', 'TROVE', 'BLOKE', 'VIVID', 'SPILL', 'CHANT', 'CHOKE', 'RUPEE', 'NASTY', 'MOURN', 'AHEAD', 'BRINE', 'CLOTH', 'HOARD', 'SWEET', 'MONTH', 'LAPSE', 'WATCH', 'TODAY', 'FOCUS', 'SMELT', 'TEASE', 'CATER', 'MOVIE', 'LYNCH', 'SAUTE', 'ALLOW', 'RENEW', 'THEIR', 'SLOSH', 'PURGE', 'CHEST', 'DEPOT', 'EPOXY', 'NYMPH', 'FOUND', 'SHALL', 'HARRY', 'STOVE', 'LOWLY', 'SNOUT', 'TROPE', 'FEWER', 'SHAWL', 'NATAL', 'FIBRE', 'COMMA', 'FORAY', 'SCARE', 'STAIR', 'BLACK', 'SQUAD', 'ROYAL', 'CHUNK', 'MINCE', 'SLAVE', 'SHAME', 'CHEEK', 'AMPLE', 'FLAIR', 'FOYER', 'CARGO', 'OXIDE', 'PLANT', 'OLIVE', 'INERT', 'ASKEW', 'HEIST', 'SHOWN', 'ZESTY', 'HASTY', 'TRASH', 'FELLA', 'LARVA', 'FORGO', 'STORY', 'HAIRY', 'TRAIN', 'HOMER', 'BADGE', 'MIDST', 'CANNY', 'FETUS', 'BUTCH', 'FARCE', 'SLUNG', 'TIPSY', 'METAL', 'YIELD', 'DELVE', 'BEING', 'SCOUR', 'GLASS', 'GAMER', 'SCRAP', 'MONEY', 'HINGE', 'ALBUM', 'VOUCH', 'ASSET', 'TIARA', 'CREPT', 'BAYOU', 'ATOLL', 'MANOR', 'CREAK', 'SHOWY', 'PHASE', 'FROTH', 'DEPTH', 'GLOOM', 'FLOOD', 'TRAIT', 'GIRTH', 'PIETY', 'PAYER', 'GOOSE', 'FLOAT', 'DONOR', 'ATONE', 'PRIMO', 'APRON', 'BLOWN', 'CACAO', 'LOSER', 'INPUT', 'GLOAT', 'AWFUL', 'BRINK', 'SMITE', 'BEADY', 'RUSTY', 'RETRO', 'DROLL', 'GAWKY', 'HUTCH', 'PINTO', 'GAILY', 'EGRET', 'LILAC', 'SEVER', 'FIELD', 'FLUFF', 'HYDRO', 'FLACK', 'AGAPE', 'WENCH', 'VOICE', 'STEAD', 'STALK', 'BERTH', 'MADAM', 'NIGHT', 'BLAND', 'LIVER', 'WEDGE', 'AUGUR', 'ROOMY', 'WACKY', 'FLOCK', 'ANGRY', 'BOBBY', 'TRITE', 'APHID', 'TRYST', 'MIDGE', 'POWER', 'ELOPE', 'CINCH', 'MOTTO', 'STOMP', 'UPSET', 'BLUFF', 'CRAMP', 'QUART', 'COYLY', 'YOUTH', 'RHYME', 'BUGGY', 'ALIEN', 'SMEAR', 'UNFIT', 'PATTY', 'CLING', 'GLEAN', 'LABEL', 'HUNKY', 'KHAKI', 'POKER', 'GRUEL', 'TWICE', 'TWANG', 'SHRUG', 'TREAT', 'UNLIT', 'WASTE', 'MERIT', 'WOVEN', 'OCTAL', 'NEEDY', 'CLOWN', 'WIDOW', 'IRONY', 'RUDER', 'GAUZE', 'CHIEF', 'ONSET', 'PRIZE', 'FUNGI', 'CHARM', 'GULLY', 'INTER', 'WHOOP', 'TAUNT', 'LEERY', 'CLASS', 'THEME', 'LOFTY', 'TIBIA', 'BOOZE', 'ALPHA', 'THYME', 'ECLAT', 'DOUBT', 'PARER', 'CHUTE', 'STICK', 'TRICE', 'ALIKE', 'SOOTH', 'RECAP', 'SAINT', 'LIEGE', 'GLORY', 'GRATE', 'ADMIT', 'BRISK', 'SOGGY', 'USURP', 'SCALD', 'SCORN', 'LEAVE', 'TWINE', 'STING', 'BOUGH', 'MARSH', 'SLOTH', 'DANDY', 'VIGOR', 'HOWDY', 'ENJOY', 'VALID', 'IONIC', 'EQUAL', 'UNSET', 'FLOOR', 'CATCH', 'SPADE', 'STEIN', 'EXIST', 'QUIRK', 'DENIM', 'GROVE', 'SPIEL', 'MUMMY', 'FAULT', 'FOGGY', 'FLOUT', 'CARRY', 'SNEAK', 'LIBEL', 'WALTZ', 'APTLY', 'PINEY', 'INEPT', 'ALOUD', 'PHOTO', 'DREAM', 'STALE', 'VOMIT', 'OMBRE', 'FANNY', 'UNITE', 'SNARL', 'BAKER', 'THERE', 'GLYPH', 'POOCH', 'HIPPY', 'SPELL', 'FOLLY', 'LOUSE', 'GULCH', 'VAULT', 'GODLY', 'THREW', 'FLEET', 'GRAVE', 'INANE', 'SHOCK', 'CRAVE', 'SPITE', 'VALVE', 'SKIMP', 'CLAIM', 'RAINY', 'MUSTY', 'PIQUE', 'DADDY', 'QUASI', 'ARISE', 'AGING', 'VALET', 'OPIUM', 'AVERT', 'STUCK', 'RECUT', 'MULCH', 'GENRE', 'PLUME', 'RIFLE', 'COUNT', 'INCUR', 'TOTAL', 'WREST', 'MOCHA', 'DETER', 'STUDY', 'LOVER', 'SAFER', 'RIVET', 'FUNNY', 'SMOKE', 'MOUND', 'UNDUE', 'SEDAN', 'PAGAN', 'SWINE', 'GUILE', 'GUSTY', 'EQUIP', 'TOUGH', 'CANOE', 'CHAOS', 'COVET', 'HUMAN', 'UDDER', 'LUNCH', 'BLAST', 'STRAY', 'MANGA', 'MELEE', 'LEFTY', 'QUICK', 'PASTE', 'GIVEN', 'OCTET', 'RISEN', 'GROAN', 'LEAKY', 'GRIND', 'CARVE', 'LOOSE', 'SADLY', 'SPILT', 'APPLE', 'SLACK', 'HONEY', 'FINAL', 'SHEEN', 'EERIE', 'MINTY', 'SLICK', 'DERBY', 'WHARF', 'SPELT', 'COACH', 'ERUPT', 'SINGE', 'PRICE', 'SPAWN', 'FAIRY', 'JIFFY', 'FILMY', 'STACK', 'CHOSE', 'SLEEP', 'ARDOR', 'NANNY', 'NIECE', 'WOOZY', 'HANDY', 'GRACE', 'DITTO', 'STANK', 'CREAM', 'USUAL', 'DIODE', 'VALOR', 'ANGLE', 'NINJA', 'MUDDY', 'CHASE', 'REPLY', 'PRONE', 'SPOIL', 'HEART', 'SHADE', 'DINER', 'ARSON', 'ONION', 'SLEET', 'DOWEL', 'COUCH', 'PALSY', 'BOWEL', 'SMILE', 'EVOKE', 'CREEK', 'LANCE', 'EAGLE', 'IDIOT', 'SIREN', 'BUILT', 'EMBED', 'AWARD', 'DROSS', 'ANNUL', 'GOODY', 'FROWN', 'PATIO', 'LADEN', 'HUMID', 'ELITE', 'LYMPH', 'EDIFY', 'MIGHT', 'RESET', 'VISIT', 'GUSTO', 'PURSE', 'VAPOR', 'CROCK', 'WRITE', 'SUNNY', 'LOATH', 'CHAFF', 'SLIDE', 'QUEER', 'VENOM', 'STAMP', 'SORRY', 'STILL', 'ACORN', 'APING', 'PUSHY', 'TAMER', 'HATER', 'MANIA', 'AWOKE', 'BRAWN', 'SWIFT', 'EXILE', 'BIRCH', 'LUCKY', 'FREER', 'RISKY', 'GHOST', 'PLIER', 'LUNAR', 'WINCH', 'SNARE', 'NURSE', 'HOUSE', 'BORAX', 'NICER', 'LURCH', 'EXALT', 'ABOUT', 'SAVVY', 'TOXIN', 'TUNIC', 'PRIED', 'INLAY', 'CHUMP', 'LANKY', 'CRESS', 'EATER', 'ELUDE', 'CYCLE', 'KITTY', 'BOULE', 'MORON', 'TENET', 'PLACE', 'LOBBY', 'PLUSH', 'VIGIL', 'INDEX', 'BLINK', 'CLUNG', 'QUALM', 'CROUP', 'CLINK', 'JUICY', 'STAGE', 'DECAY', 'NERVE', 'FLIER', 'SHAFT', 'CROOK', 'CLEAN', 'CHINA', 'RIDGE', 'VOWEL', 'GNOME', 'SNUCK', 'ICING', 'SPINY', 'RIGOR', 'SNAIL', 'FLOWN', 'RABID', 'PROSE', 'THANK', 'POPPY', 'BUDGE', 'FIBER', 'MOLDY', 'DOWDY', 'KNEEL', 'TRACK', 'CADDY', 'QUELL', 'DUMPY', 'PALER', 'SWORE', 'REBAR', 'SCUBA', 'SPLAT', 'FLYER', 'HORNY', 'MASON', 'DOING', 'OZONE', 'AMPLY', 'MOLAR', 'OVARY', 'BESET', 'QUEUE', 'CLIFF', 'MAGIC', 'TRUCE', 'SPORT', 'FRITZ', 'EDICT', 'TWIRL', 'VERSE', 'LLAMA', 'EATEN', 'RANGE', 'WHISK', 'HOVEL', 'REHAB', 'MACAW', 'SIGMA', 'SPOUT', 'VERVE', 'SUSHI', 'DYING', 'FETID', 'BRAIN', 'BUDDY', 'THUMP', 'SCION', 'CANDY', 'CHORD', 'BASIN', 'MARCH', 'CROWD', 'ARBOR', 'GAYLY', 'MUSKY', 'STAIN', 'DALLY', 'BLESS', 'BRAVO', 'STUNG', 'TITLE', 'RULER', 'KIOSK', 'BLOND', 'ENNUI', 'LAYER', 'FLUID', 'TATTY', 'SCORE', 'CUTIE', 'ZEBRA', 'BARGE', 'MATEY', 'BLUER', 'AIDER', 'SHOOK', 'RIVER', 'PRIVY', 'BETEL', 'FRISK', 'BONGO', 'BEGUN', 'AZURE', 'WEAVE', 'GENIE', 'SOUND', 'GLOVE', 'BRAID', 'SCOPE', 'WRYLY', 'ROVER', 'ASSAY', 'OCEAN', 'BLOOM', 'IRATE', 'LATER', 'WOKEN', 'SILKY', 'WRECK', 'DWELT', 'SLATE', 'SMACK', 'SOLID', 'AMAZE', 'HAZEL', 'WRIST', 'JOLLY', 'GLOBE', 'FLINT', 'ROUSE', 'CIVIL', 'VISTA', 'RELAX', 'COVER', 'ALIVE', 'BEECH', 'JETTY', 'BLISS', 'VOCAL', 'OFTEN', 'DOLLY', 'EIGHT', 'JOKER', 'SINCE', 'EVENT', 'ENSUE', 'SHUNT', 'DIVER', 'POSER', 'WORST', 'SWEEP', 'ALLEY', 'CREED', 'ANIME', 'LEAFY', 'BOSOM', 'DUNCE', 'STARE', 'PUDGY', 'WAIVE', 'CHOIR', 'STOOD', 'SPOKE', 'OUTGO', 'DELAY', 'BILGE', 'IDEAL', 'CLASP', 'SEIZE', 'HOTLY', 'LAUGH', 'SIEVE', 'BLOCK', 'MEANT', 'GRAPE', 'NOOSE', 'HARDY', 'SHIED', 'DRAWL', 'DAISY', 'PUTTY', 'STRUT', 'BURNT', 'TULIP', 'CRICK', 'IDYLL', 'VIXEN', 'FUROR', 'GEEKY', 'COUGH', 'NAIVE', 'SHOAL', 'STORK', 'BATHE', 'AUNTY', 'CHECK', 'PRIME', 'BRASS', 'OUTER', 'FURRY', 'RAZOR', 'ELECT', 'EVICT', 'IMPLY', 'DEMUR', 'QUOTA', 'HAVEN', 'CAVIL', 'SWEAR', 'CRUMP', 'DOUGH', 'GAVEL', 'WAGON', 'SALON', 'NUDGE', 'HAREM', 'PITCH', 'SWORN', 'PUPIL', 'EXCEL', 'STONY', 'CABIN', 'UNZIP', 'QUEEN', 'TROUT', 'POLYP', 'EARTH', 'STORM', 'UNTIL', 'TAPER', 'ENTER', 'CHILD', 'ADOPT', 'MINOR', 'FATTY', 'HUSKY', 'BRAVE', 'FILET', 'SLIME', 'GLINT', 'TREAD', 'STEAL', 'REGAL', 'GUEST', 'EVERY', 'MURKY', 'SHARE', 'SPORE', 'HOIST', 'BUXOM', 'INNER', 'OTTER', 'DIMLY', 'LEVEL', 'SUMAC', 'DONUT', 'STILT', 'ARENA', 'SHEET', 'SCRUB', 'FANCY', 'SLIMY', 'PEARL', 'SILLY', 'PORCH', 'DINGO', 'SEPIA', 'AMBLE', 'SHADY', 'BREAD', 'FRIAR', 'REIGN', 'DAIRY', 'QUILL', 'CROSS', 'BROOD', 'TUBER', 'SHEAR', 'POSIT', 'BLANK', 'VILLA', 'SHANK', 'PIGGY', 'FREAK', 'WHICH', 'AMONG', 'FECAL', 'SHELL', 'WOULD', 'ALGAE', 'LARGE', 'RABBI', 'AGONY', 'AMUSE', 'BUSHY', 'COPSE', 'SWOON', 'KNIFE', 'POUCH', 'ASCOT', 'PLANE', 'CROWN', 'URBAN', 'SNIDE', 'RELAY', 'ABIDE', 'VIOLA', 'RAJAH', 'STRAW', 'DILLY', 'CRASH', 'AMASS', 'THIRD', 'TRICK', 'TUTOR', 'WOODY', 'BLURB', 'GRIEF', 'DISCO', 'WHERE', 'SASSY', 'BEACH', 'SAUNA', 'COMIC', 'CLUED', 'CREEP', 'CASTE', 'GRAZE', 'SNUFF', 'FROCK', 'GONAD', 'DRUNK', 'PRONG', 'LURID', 'STEEL', 'HALVE', 'BUYER', 'VINYL', 'UTILE', 'SMELL', 'ADAGE', 'WORRY', 'TASTY', 'LOCAL', 'TRADE', 'FINCH', 'ASHEN', 'MODAL', 'GAUNT', 'CLOVE', 'ENACT', 'ADORN', 'ROAST', 'SPECK', 'SHEIK', 'MISSY', 'GRUNT', 'SNOOP', 'PARTY', 'TOUCH', 'MAFIA', 'EMCEE', 'ARRAY', 'SOUTH', 'VAPID', 'JELLY', 'SKULK', 'ANGST', 'TUBAL', 'LOWER', 'CREST', 'SWEAT', 'CYBER', 'ADORE', 'TARDY', 'SWAMI', 'NOTCH', 'GROOM', 'ROACH', 'HITCH', 'YOUNG', 'ALIGN', 'READY', 'FROND', 'STRAP', 'PUREE', 'REALM', 'VENUE', 'SWARM', 'OFFER', 'SEVEN', 'DRYER', 'DIARY', 'DRYLY', 'DRANK', 'ACRID', 'HEADY', 'THETA', 'JUNTO', 'PIXIE', 'QUOTH', 'BONUS', 'SHALT', 'PENNE', 'AMEND', 'DATUM', 'BUILD', 'PIANO', 'SHELF', 'LODGE', 'SUING', 'REARM', 'CORAL', 'RAMEN', 'WORTH', 'PSALM', 'INFER', 'OVERT', 'MAYOR', 'OVOID', 'GLIDE', 'USAGE', 'POISE', 'RANDY', 'CHUCK', 'PRANK', 'FISHY', 'TOOTH', 'ETHER', 'DROVE', 'IDLER', 'SWATH', 'STINT', 'WHILE', 'BEGAT', 'APPLY', 'SLANG', 'TAROT', 'RADAR', 'CREDO', 'AWARE', 'CANON', 'SHIFT', 'TIMER', 'BYLAW', 'SERUM', 'THREE', 'STEAK', 'ILIAC', 'SHIRK', 'BLUNT', 'PUPPY', 'PENAL', 'JOIST', 'BUNNY', 'SHAPE', 'BEGET', 'WHEEL', 'ADEPT', 'STUNT', 'STOLE', 'TOPAZ', 'CHORE', 'FLUKE', 'AFOOT', 'BLOAT', 'BULLY', 'DENSE', 'CAPER', 'SNEER', 'BOXER', 'JUMBO', 'LUNGE', 'SPACE', 'AVAIL', 'SHORT', 'SLURP', 'LOYAL', 'FLIRT', 'PIZZA', 'CONCH', 'TEMPO', 'DROOP', 'PLATE', 'BIBLE', 'PLUNK', 'AFOUL', 'SAVOY', 'STEEP', 'AGILE', 'STAKE', 'DWELL', 'KNAVE', 'BEARD', 'AROSE', 'MOTIF', 'SMASH', 'BROIL', 'GLARE', 'SHOVE', 'BAGGY', 'MAMMY', 'SWAMP', 'ALONG', 'RUGBY', 'WAGER', 'QUACK', 'SQUAT', 'SNAKY', 'DEBIT', 'MANGE', 'SKATE', 'NINTH', 'JOUST', 'TRAMP', 'SPURN', 'MEDAL', 'MICRO', 'REBEL', 'FLANK', 'LEARN', 'NADIR', 'MAPLE', 'COMFY', 'REMIT', 'GRUFF', 'ESTER', 'LEAST', 'MOGUL', 'FETCH', 'CAUSE', 'OAKEN', 'AGLOW', 'MEATY', 'GAFFE', 'SHYLY', 'RACER', 'PROWL', 'THIEF', 'STERN', 'POESY', 'ROCKY', 'TWEET', 'WAIST', 'SPIRE', 'GROPE', 'HAVOC', 'PATSY', 'TRULY', 'FORTY', 'DEITY', 'UNCLE', 'SWISH', 'GIVER', 'PREEN', 'BEVEL', 'LEMUR', 'DRAFT', 'SLOPE', 'ANNOY', 'LINGO', 'BLEAK', 'DITTY', 'CURLY', 'CEDAR', 'DIRGE', 'GROWN', 'HORDE', 'DROOL', 'SHUCK', 'CRYPT', 'CUMIN', 'STOCK', 'GRAVY', 'LOCUS', 'WIDER', 'BREED', 'QUITE', 'CHAFE', 'CACHE', 'BLIMP', 'DEIGN', 'FIEND', 'LOGIC', 'CHEAP', 'ELIDE', 'RIGID', 'FALSE', 'RENAL', 'PENCE', 'ROWDY', 'SHOOT', 'BLAZE', 'ENVOY', 'POSSE', 'BRIEF', 'NEVER', 'ABORT', 'MOUSE', 'MUCKY', 'SULKY', 'FIERY', 'MEDIA', 'TRUNK', 'YEAST', 'CLEAR', 'SKUNK', 'SCALP', 'BITTY', 'CIDER', 'KOALA', 'DUVET', 'SEGUE', 'CREME', 'SUPER', 'GRILL', 'AFTER', 'OWNER', 'EMBER', 'REACH', 'NOBLY', 'EMPTY', 'SPEED', 'GIPSY', 'RECUR', 'SMOCK', 'DREAD', 'MERGE', 'BURST', 'KAPPA', 'AMITY', 'SHAKY', 'HOVER', 'CAROL', 'SNORT', 'SYNOD', 'FAINT', 'HAUNT', 'FLOUR', 'CHAIR', 'DETOX', 'SHREW', 'TENSE', 'PLIED', 'QUARK', 'BURLY', 'NOVEL', 'WAXEN', 'STOIC', 'JERKY', 'BLITZ', 'BEEFY', 'LYRIC', 'HUSSY', 'TOWEL', 'QUILT', 'BELOW', 'BINGO', 'WISPY', 'BRASH', 'SCONE', 'TOAST', 'EASEL', 'SAUCY', 'VALUE', 'SPICE', 'HONOR', 'ROUTE', 'SHARP', 'BAWDY', 'RADII', 'SKULL', 'PHONY', 'ISSUE', 'LAGER', 'SWELL', 'URINE', 'GASSY', 'TRIAL', 'FLORA', 'UPPER', 'LATCH', 'WIGHT', 'BRICK', 'RETRY', 'HOLLY', 'DECAL', 'GRASS', 'SHACK', 'DOGMA', 'MOVER', 'DEFER', 'SOBER', 'OPTIC', 'CRIER', 'VYING', 'NOMAD', 'FLUTE', 'HIPPO', 'SHARK', 'DRIER', 'OBESE', 'BUGLE', 'TAWNY', 'CHALK', 'FEAST', 'RUDDY', 'PEDAL', 'SCARF', 'CRUEL', 'BLEAT', 'TIDAL', 'SLUSH', 'SEMEN', 'WINDY', 'DUSTY', 'SALLY', 'IGLOO', 'NERDY', 'JEWEL', 'SHONE', 'WHALE', 'HYMEN', 'ABUSE', 'FUGUE', 'ELBOW', 'CRUMB', 'PANSY', 'WELSH', 'SYRUP', 'TERSE', 'SUAVE', 'GAMUT', 'SWUNG', 'DRAKE', 'FREED', 'AFIRE', 'SHIRT', 'GROUT', 'ODDLY', 'TITHE', 'PLAID', 'DUMMY', 'BROOM', 'BLIND', 'TORCH', 'ENEMY', 'AGAIN', 'TYING', 'PESKY', 'ALTER', 'GAZER', 'NOBLE', 'ETHOS', 'BRIDE', 'EXTOL', 'DECOR', 'HOBBY', 'BEAST', 'IDIOM', 'UTTER', 'THESE', 'SIXTH', 'ALARM', 'ERASE', 'ELEGY', 'SPUNK', 'PIPER', 'SCALY', 'SCOLD', 'HEFTY', 'CHICK', 'SOOTY', 'CANAL', 'WHINY', 'SLASH', 'QUAKE', 'JOINT', 'SWEPT', 'PRUDE', 'HEAVY', 'WIELD', 'FEMME', 'LASSO', 'MAIZE', 'SHALE', 'SCREW', 'SPREE', 'SMOKY', 'WHIFF', 'SCENT', 'GLADE', 'SPENT', 'PRISM', 'STOKE', 'RIPER', 'ORBIT', 'COCOA', 'GUILT', 'HUMUS', 'SHUSH', 'TABLE', 'SMIRK', 'WRONG', 'NOISY', 'ALERT', 'SHINY', 'ELATE', 'RESIN', 'WHOLE', 'HUNCH', 'PIXEL', 'POLAR', 'HOTEL', 'SWORD', 'CLEAT', 'MANGO', 'RUMBA', 'PUFFY', 'FILLY', 'BILLY', 'LEASH', 'CLOUT', 'DANCE', 'OVATE', 'FACET', 'CHILI', 'PAINT', 'LINER', 'CURIO', 'SALTY', 'AUDIO', 'SNAKE', 'FABLE', 'CLOAK', 'NAVEL', 'SPURT', 'PESTO', 'BALMY', 'FLASH', 'UNWED', 'EARLY', 'CHURN', 'WEEDY', 'STUMP', 'LEASE', 'WITTY', 'WIMPY', 'SPOOF', 'SANER', 'BLEND', 'SALSA', 'THICK', 'WARTY', 'MANIC', 'BLARE', 'SQUIB', 'SPOON', 'PROBE', 'CREPE', 'KNACK', 'FORCE', 'DEBUT', 'ORDER', 'HASTE', 'TEETH', 'AGENT', 'WIDEN', 'ICILY', 'SLICE', 'INGOT', 'CLASH', 'JUROR', 'BLOOD', 'ABODE', 'THROW', 'UNITY', 'PIVOT', 'SLEPT', 'TROOP', 'SPARE', 'SEWER', 'PARSE', 'MORPH', 'CACTI', 'TACKY', 'SPOOL', 'DEMON', 'MOODY', 'ANNEX', 'BEGIN', 'FUZZY', 'PATCH', 'WATER', 'LUMPY', 'ADMIN', 'OMEGA', 'LIMIT', 'TABBY', 'MACHO', 'AISLE', 'SKIFF', 'BASIS', 'PLANK', 'VERGE', 'BOTCH', 'CRAWL', 'LOUSY', 'SLAIN', 'CUBIC', 'RAISE', 'WRACK', 'GUIDE', 'FOIST', 'CAMEO', 'UNDER', 'ACTOR', 'REVUE', 'FRAUD', 'HARPY', 'SCOOP', 'CLIMB', 'REFER', 'OLDEN', 'CLERK', 'DEBAR', 'TALLY', 'ETHIC', 'CAIRN', 'TULLE', 'GHOUL', 'HILLY', 'CRUDE', 'APART', 'SCALE', 'OLDER', 'PLAIN', 'SPERM', 'BRINY', 'ABBOT', 'RERUN', 'QUEST', 'CRISP', 'BOUND', 'BEFIT', 'DRAWN', 'SUITE', 'ITCHY', 'CHEER', 'BAGEL', 'GUESS', 'BROAD', 'AXIOM', 'CHARD', 'CAPUT', 'LEANT', 'HARSH', 'CURSE', 'PROUD', 'SWING', 'OPINE', 'TASTE', 'LUPUS', 'GUMBO', 'MINER', 'GREEN', 'CHASM', 'LIPID', 'TOPIC', 'ARMOR', 'BRUSH', 'CRANE', 'MURAL', 'ABLED', 'HABIT', 'BOSSY', 'MAKER', 'DUSKY', 'DIZZY', 'LITHE', 'BROOK', 'JAZZY', 'FIFTY', 'SENSE', 'GIANT', 'SURLY', 'LEGAL', 'FATAL', 'FLUNK', 'BEGAN', 'PRUNE', 'SMALL', 'SLANT', 'SCOFF', 'TORUS', 'NINNY', 'COVEY', 'VIPER', 'TAKEN', 'MORAL', 'VOGUE', 'OWING', 'TOKEN', 'ENTRY', 'BOOTH', 'VOTER', 'CHIDE', 'ELFIN', 'EBONY', 'NEIGH', 'MINIM', 'MELON', 'KNEED', 'DECOY', 'VOILA', 'ANKLE', 'ARROW', 'MUSHY', 'TRIBE', 'CEASE', 'EAGER', 'BIRTH', 'GRAPH', 'ODDER', 'TERRA', 'WEIRD', 'TRIED', 'CLACK', 'COLOR', 'ROUGH', 'WEIGH', 'UNCUT', 'LADLE', 'STRIP', 'CRAFT', 'MINUS', 'DICEY', 'TITAN', 'LUCID', 'VICAR', 'DRESS', 'DITCH', 'GYPSY', 'PASTA', 'TAFFY', 'FLAME', 'SWOOP', 'ALOOF', 'SIGHT', 'BROKE', 'TEARY', 'CHART', 'SIXTY', 'WORDY', 'SHEER', 'LEPER', 'NOSEY', 'BULGE', 'SAVOR', 'CLAMP', 'FUNKY', 'FOAMY', 'TOXIC', 'BRAND', 'PLUMB', 'DINGY', 'BUTTE', 'DRILL', 'TRIPE', 'BICEP', 'TENOR', 'KRILL', 'WORSE', 'DRAMA', 'HYENA', 'THINK', 'RATIO', 'COBRA', 'BASIL', 'SCRUM', 'BUSED', 'PHONE', 'COURT', 'CAMEL', 'PROOF', 'HEARD', 'ANGEL', 'PETAL', 'POUTY', 'THROB', 'MAYBE', 'FETAL', 'SPRIG', 'SPINE', 'SHOUT', 'CADET', 'MACRO', 'DODGY', 'SATYR', 'RARER', 'BINGE', 'TREND', 'NUTTY', 'LEAPT', 'AMISS', 'SPLIT', 'MYRRH', 'WIDTH', 'SONAR', 'TOWER', 'BARON', 'FEVER', 'WAVER', 'SPARK', 'BELIE', 'SLOOP', 'EXPEL', 'SMOTE', 'BALER', 'ABOVE', 'NORTH', 'WAFER', 'SCANT', 'FRILL', 'AWASH', 'SNACK', 'SCOWL', 'FRAIL', 'DRIFT', 'LIMBO', 'FENCE', 'MOTEL', 'OUNCE', 'WREAK', 'REVEL', 'TALON', 'PRIOR', 'KNELT', 'CELLO', 'FLAKE', 'DEBUG', 'ANODE', 'CRIME', 'SALVE', 'SCOUT', 'IMBUE', 'PINKY', 'STAVE', 'VAGUE', 'CHOCK', 'FIGHT', 'VIDEO', 'STONE', 'TEACH', 'CLEFT', 'FROST', 'PRAWN', 'BOOTY', 'TWIST', 'APNEA', 'STIFF', 'PLAZA', 'LEDGE', 'TWEAK', 'BOARD', 'GRANT', 'MEDIC', 'BACON', 'CABLE', 'BRAWL', 'SLUNK', 'RASPY', 'FORUM', 'DRONE', 'WOMEN', 'MUCUS', 'BOAST', 'TODDY', 'COVEN', 'TUMOR', 'TRUER', 'WRATH', 'STALL', 'STEAM', 'AXIAL', 'PURER', 'DAILY', 'TRAIL', 'NICHE', 'MEALY', 'JUICE', 'NYLON', 'PLUMP', 'MERRY', 'FLAIL', 'PAPAL', 'WHEAT', 'BERRY', 'COWER', 'ERECT', 'BRUTE', 'LEGGY', 'SNIPE', 'SINEW', 'SKIER', 'PENNY', 'JUMPY', 'RALLY', 'UMBRA', 'SCARY', 'MODEM', 'GROSS', 'AVIAN', 'GREED', 'SATIN', 'TONIC', 'PARKA', 'SNIFF', 'LIVID', 'STARK', 'TRUMP', 'GIDDY', 'REUSE', 'TABOO', 'AVOID', 'QUOTE', 'DEVIL', 'LIKEN', 'GLOSS', 'GAYER', 'BERET', 'NOISE', 'GLAND', 'DEALT', 'SLING', 'RUMOR', 'OPERA', 'THIGH', 'TONGA', 'FLARE', 'WOUND', 'WHITE', 'BULKY', 'ETUDE', 'HORSE', 'CIRCA', 'PADDY', 'INBOX', 'FIZZY', 'GRAIN', 'EXERT', 'SURGE', 'GLEAM', 'BELLE', 'SALVO', 'CRUSH', 'FRUIT', 'SAPPY', 'TAKER', 'TRACT', 'OVINE', 'SPIKY', 'FRANK', 'REEDY', 'FILTH', 'SPASM', 'HEAVE', 'MAMBO', 'RIGHT', 'CLANK', 'TRUST', 'LUMEN', 'BORNE', 'SPOOK', 'SAUCE', 'AMBER', 'LATHE', 'CARAT', 'CORER', 'DIRTY', 'SLYLY', 'AFFIX', 'ALLOY', 'TAINT', 'SHEEP', 'KINKY', 'WOOLY', 'MAUVE', 'FLUNG', 'YACHT', 'FRIED', 'QUAIL', 'BRUNT', 'GRIMY', 'CURVY', 'CAGEY', 'RINSE', 'DEUCE', 'STATE', 'GRASP', 'MILKY', 'BISON', 'GRAFT', 'SANDY', 'BASTE', 'FLASK', 'HEDGE', 'GIRLY', 'SWASH', 'BONEY', 'COUPE', 'ENDOW', 'ABHOR', 'WELCH', 'BLADE', 'TIGHT', 'GEESE', 'MISER', 'MIRTH', 'CLOUD', 'CABAL', 'LEECH', 'CLOSE', 'TENTH', 'PECAN', 'DROIT', 'GRAIL', 'CLONE', 'GUISE', 'RALPH', 'TANGO', 'BIDDY', 'SMITH', 'MOWER', 'PAYEE', 'SERIF', 'DRAPE', 'FIFTH', 'SPANK', 'GLAZE', 'ALLOT', 'TRUCK', 'KAYAK', 'VIRUS', 'TESTY', 'TEPEE', 'FULLY', 'ZONAL', 'METRO', 'CURRY', 'GRAND', 'BANJO', 'AXION', 'BEZEL', 'OCCUR', 'CHAIN', 'NASAL', 'GOOEY', 'FILER', 'BRACE', 'ALLAY', 'PUBIC', 'RAVEN', 'PLEAD', 'GNASH', 'FLAKY', 'MUNCH', 'DULLY', 'EKING', 'THING', 'SLINK', 'HURRY', 'THEFT', 'SHORN', 'PYGMY', 'RANCH', 'WRING', 'LEMON', 'SHORE', 'MAMMA', 'FROZE', 'NEWER', 'STYLE', 'MOOSE', 'ANTIC', 'DROWN', 'VEGAN', 'CHESS', 'GUPPY', 'UNION', 'LEVER', 'LORRY', 'IMAGE', 'CABBY', 'DRUID', 'EXACT', 'TRUTH', 'DOPEY', 'SPEAR', 'CRIED', 'CHIME', 'CRONY', 'STUNK', 'TIMID', 'BATCH', 'GAUGE', 'ROTOR', 'CRACK', 'CURVE', 'LATTE', 'WITCH', 'BUNCH', 'REPEL', 'ANVIL', 'SOAPY', 'METER', 'BROTH', 'MADLY', 'DRIED', 'SCENE', 'KNOWN', 'MAGMA', 'ROOST', 'WOMAN', 'THONG', 'PUNCH', 'PASTY', 'DOWNY', 'KNEAD', 'WHIRL', 'RAPID', 'CLANG', 'ANGER', 'DRIVE', 'GOOFY', 'EMAIL', 'MUSIC', 'STUFF', 'BLEEP', 'RIDER', 'MECCA', 'FOLIO', 'SETUP', 'VERSO', 'QUASH', 'FAUNA', 'GUMMY', 'HAPPY', 'NEWLY', 'FUSSY', 'RELIC', 'GUAVA', 'RATTY', 'FUDGE', 'FEMUR', 'CHIRP', 'FORTE', 'ALIBI', 'WHINE', 'PETTY', 'GOLLY', 'PLAIT', 'FLECK', 'FELON', 'GOURD', 'BROWN', 'THRUM', 'FICUS', 'STASH', 'DECRY', 'WISER', 'JUNTA', 'VISOR', 'DAUNT', 'SCREE', 'IMPEL', 'AWAIT', 'PRESS', 'WHOSE', 'TURBO', 'STOOP', 'SPEAK', 'MANGY', 'EYING', 'INLET', 'CRONE', 'PULSE', 'MOSSY', 'STAID', 'HENCE', 'PINCH', 'TEDDY', 'SULLY', 'SNORE', 'RIPEN', 'SNOWY', 'ATTIC', 'GOING', 'LEACH', 'MOUTH', 'HOUND', 'CLUMP', 'TONAL', 'BIGOT', 'PERIL', 'PIECE', 'BLAME', 'HAUTE', 'SPIED', 'UNDID', 'INTRO', 'BASAL', 'SHINE', 'GECKO', 'RODEO', 'GUARD', 'STEER', 'LOAMY', 'SCAMP', 'SCRAM', 'MANLY', 'HELLO', 'VAUNT', 'ORGAN', 'FERAL', 'KNOCK', 'EXTRA', 'CONDO', 'ADAPT', 'WILLY', 'POLKA', 'RAYON', 'SKIRT', 'FAITH', 'TORSO', 'MATCH', 'MERCY', 'TEPID', 'SLEEK', 'RISER', 'TWIXT', 'PEACE', 'FLUSH', 'CATTY', 'LOGIN', 'EJECT', 'ROGER', 'RIVAL', 'UNTIE', 'REFIT', 'AORTA', 'ADULT', 'JUDGE', 'ROWER', 'ARTSY', 'RURAL', 'SHAVE']
+	# Finishes off partial solutions, given as (guesses, pool) pairs, by
+	# making the best guess for each pool until one of them is solved. If
+	# limit is given, each step only looks at that many guesses, those using
+	# the pool's commonest letters first (and more only if none of them keeps
+	# the target in play), which bounds how long it takes.
+	def complete_greedily(self, partial, hardmode=None, limit=None):
+
+		while not any( len(pool) == 1 for guesses, pool in partial ):
+
+			if limit is None:
+				all_best_words = self.greedy_search_top_n_pools(1, hardmode, [ pool for guesses, pool in partial ])
+			else:
+				all_best_words = [ self.limited_best_guess(pool, hardmode, limit) for guesses, pool in partial ]
+
+			partial = [ (guesses + [best_words[0][0]], best_words[0][3]) for (guesses, pool), best_words in zip(partial, all_best_words) if best_words ]
+
+			if not partial:
+				return None
+
+		for guesses, pool in partial:
+			if len(pool) == 1:
+				return guesses + list(pool)
+
+	# complete_greedily's step with a limit: the best guess for the pool out
+	# of the first limit guesses in guess_order, then the next limit, and so
+	# on, as a one-entry list like greedy_search_top_n's (or an empty one if
+	# no guess keeps the target in play).
+	def limited_best_guess(self, pool, hardmode, limit):
+
+		order = self.guess_order(pool, range(len(self.possible_words)))
+
+		for start in range(0, len(order), limit):
+
+			best = self.shard_single(hardmode, pool, order[start : start + limit])
+
+			if best is not None:
+
+				set_size, rank, g = best
+				word = self.possible_words[g]
+
+				return [ (word, set_size, -rank, self.adversarial_step(pool, word)[1]) ]
+
+		return []
+
+	# Anytime version of recurse_tree_with_pruning: runs it with a beam of
+	# width 1, 2, 4 and so on, yielding (solution, width) whenever it finds
+	# a shorter solution than before. With a time budget (in seconds), it
+	# stops once the budget's spent, cutting the last search short if need
+	# be; otherwise it stops after max_width.
+	def anytime_search(self, hardmode=None, time_budget=None, max_width=None):
+
+		deadline = None if (time_budget is None) else perf_counter() + time_budget
+
+		if (deadline is None) and (max_width is None):
+			raise ValueError("anytime_search needs a time budget or a maximum width")
+
+		root = CandidateSet.full(self.secret_words, self.secret_index)
+
+		# The widest beam this will try: the first power of two reaching
+		# max_width, or with only a time budget, as wide as there are guesses.
+		widest = 1
+
+		while widest < (len(self.possible_words) if (max_width is None) else max_width):
+			widest *= 2
+
+		best = None
+		width = 1
+
+		while True:
+
+			# Every width starts with the same root search. The first, narrow
+			# one gets a quick first solution; after that, unless the opening
+			# book covers the width, the root's ranked as widely as any width
+			# could need, once, and each wider search takes a slice of that.
+			if (width > 1) and (self.cached_top_n((root.bits, hardmode), width) is None):
+				self.top_n_rankings(widest, hardmode, [root], deadline)
+
+			solution = self.recurse_tree_with_pruning(hardmode, width, deadline)
+
+			if (solution is not None) and ((best is None) or (len(solution) < len(best))):
+				best = solution
+				yield solution, width
+
+			if (deadline is not None) and (perf_counter() >= deadline):
+				return
+
+			if (max_width is not None) and (width >= max_width):
+				return
+
+			width *= 2
+
+	# The most responses any guess can tell apart, over all secret words
+	# (and so over any pool). Absurdle always leaves at least 1/B of a pool.
+	def max_distinct_responses(self):
+
+		if self.distinct_responses is None:
+
+			self.distinct_responses = [ len(set(self.matrix.row(g))) for g in range(len(self.possible_words)) ]
+
+			# Guesses that tell the most words apart, best first.
+			self.splitters = sorted(range(len(self.possible_words)), key=lambda g : -self.distinct_responses[g])
+
+		return self.distinct_responses[self.splitters[0]]
+
+	# Admissible lower bound on the guesses needed to win from a pool of the
+	# given size (including the final, winning guess): no guess can leave
+	# fewer than ceil(size / B) words.
+	def guesses_lower_bound(self, size):
+
+		B = self.max_distinct_responses()
+		guesses = 1
+
+		while size > 1:
+			size = -(-size // B)
+			guesses += 1
+
+		return guesses
+
+	# Exact solver. Iterative deepening over the (deterministic) Absurdle
+	# game: each round searches every guess line of a fixed length, pruning
+	# pools that provably can't be won in the guesses left, and remembering
+	# the pools it has already refuted. The first round to succeed gives an
+	# optimal solution, and the rounds before it are the certificate.
+	# Returns (None, None) if there's no solution at all: if no guess keeps
+	# the target in play, or if a round is refuted without the budget
+	# cutting anything off, so that no bigger budget could do better.
+	def exact_search(self, hardmode=None):
+
+		self.reset()
+
+		if (hardmode is not None) and (hardmode not in self.candidates):
+			return None, None
+
+		if (hardmode is not None) and (next(self.evaluate_guesses(hardmode, self.candidates, None, None, expand=False), None) is None):
+			return None, None
+
+		certificate = {
+			"max_distinct_responses" : self.max_distinct_responses(),
+			"lower_bound" : self.guesses_lower_bound(len(self.candidates)),
+			"refuted" : {},
+		}
+
+		budget = certificate["lower_bound"]
+
+		while True:
+
+			if self.stats is not None:
+				snapshot = self.stats.snapshot(self)
+
+			refuted = len(self.exact_failures)
+			self.exact_cut = False
+			solution = self.exact_recurse(self.candidates, budget, hardmode)
+
+			if self.stats is not None:
+				self.stats.level("exact", snapshot, self, budget=budget, refuted=len(self.exact_failures) - refuted)
+
+			if solution is not None:
+				certificate["optimal"] = budget
+				return solution, certificate
+
+			if not self.exact_cut:
+				return None, None
+
+			certificate["refuted"][budget] = len(self.exact_failures) - refuted
+			budget += 1
+
+	# A solution from this pool in at most budget guesses, or None.
+	def exact_recurse(self, pool, budget, hardmode=None):
+
+		if self.stats is not None:
+			self.stats.count("exact_nodes")
+
+		if len(pool) == 1:
+			return list(pool)
+
+		if self.guesses_lower_bound(len(pool)) > budget:
+			self.exact_cut = True
+			return None
+
+		key = (pool.bits, hardmode)
+
+		if self.exact_failures.get(key, 0) >= budget:
+
+			if self.stats is not None:
+				self.stats.count("exact_memo_hits")
+
+			return None
+
+		# Pools not won in two or three guesses might be with more, so those
+		# failures count as cut off by the budget.
+		if budget == 2:
+
+			split = self.exact_split(pool, hardmode)
+
+			if split is not None:
+				return [ self.possible_words[split[0]], split[1] ]
+
+			self.exact_failures[key] = budget
+			self.exact_cut = True
+			return None
+
+		if (budget == 3) and (hardmode is not None):
+
+			solution = self.exact_target_three(pool, hardmode)
+
+			if solution is None:
+				self.exact_failures[key] = budget
+				self.exact_cut = True
+
+			return solution
+
+		# Only pools small enough to be won in budget - 1 guesses are worth
+		# looking at, so use that as the cutoff for evaluating guesses.
+		limit = self.max_distinct_responses() ** (budget - 2)
+
+		children = {}
+		pruned = self.pruned
+
+		# Equivalent guesses leave the same children, so skip them.
+		for g, match, set_size, codes in self.evaluate_guesses(hardmode, pool, None, [limit], expand=False):
+
+			if set_size > limit:
+				self.exact_cut = True
+
+			if (set_size > limit) or (set_size == len(pool)):
+				continue
+
+			child = self.bucket(pool, codes, match)
+			children.setdefault(child.bits, (set_size, g, child))
+
+		# Guesses abandoned part-way were cut off by the limit too.
+		if self.pruned != pruned:
+			self.exact_cut = True
+
+		# Smaller pools are the likeliest to be won quickly.
+		for set_size, g, child in sorted(children.values(), key=lambda x : x[:2]):
+
+			solution = self.exact_recurse(child, budget - 1, hardmode)
+
+			if solution is not None:
+				return [self.possible_words[g]] + solution
+
+		self.exact_failures[key] = budget
+
+		return None
+
+	# Lookup tables for challenge mode, as bitsets:
+	#  - buckets[g] is the set of secret words sharing the target's response
+	#    to guess g, i.e. the pool Absurdle leaves if it keeps the target.
+	#  - above[w] is the set of guess indices under which secret word w's
+	#    response ranks above the target's. A guess can only leave the target
+	#    out of a perfectly-split pool if it's in above[w] for every other
+	#    word w in the pool.
+	#  - rivals[g] is a list of the next biggest buckets of guess g over all
+	#    the secret words. Absurdle can't keep the target's bucket of a pool
+	#    if one of these is bigger in it, which rules most guesses out with a
+	#    couple of popcounts.
+	rival_count = 3
+
+	def target_tables(self, hardmode):
+
+		if hardmode not in self.target_table_cache:
+
+			n = len(self.possible_words)
+			target = self.secret_index[hardmode]
+			binary = bytes.maketrans(b"\0\1", b"01")
+			size = self.matrix.code_size
+
+			buckets = []
+			rivals = []
+
+			for g in range(n):
+
+				row = self.matrix.row(g)
+				raw = bytes(row)
+
+				codes = [ code for code, count in Counter(row).most_common(self.rival_count + 1) if code != row[target] ]
+
+				buckets.append(matching_bits(raw, row[target], size))
+				rivals.append([ matching_bits(raw, code, size) for code in codes[:self.rival_count] ])
+
+			# Compare ranks in lanes twice the width of a rank, one per guess:
+			# with h the rank width, each lane of word + (2^h - 1) - target has
+			# bit h set iff word ranks above target. One-byte ranks go through
+			# a translation table; wider ones are looked up one by one.
+			k = 2 * size
+			rank_bytes = bytes(self.response_rank).ljust(256, b"\0") if (size == 1) else None
+
+			def lanes(column):
+
+				if size == 1:
+					buf = bytearray(k * n)
+					buf[0::k] = column.translate(rank_bytes)
+				else:
+					buf = array("I", map(self.response_rank.__getitem__, column)).tobytes()
+
+				return int.from_bytes(buf, "little")
+
+			target_lanes = lanes(self.matrix.column(target))
+			offset = int.from_bytes((b"\xff" * size).ljust(k, b"\0") * n, "little")
+			mask = int.from_bytes((b"\0" * size + b"\1").ljust(k, b"\0") * n, "little")
+
+			above = []
+
+			for w in range(len(self.secret_words)):
+
+				flags = ((lanes(self.matrix.column(w)) + offset - target_lanes) & mask).to_bytes(k * n, "little")[size::k]
+				above.append(int(flags.translate(binary)[::-1], 2))
+
+			self.target_table_cache[hardmode] = (buckets, above, rivals)
+
+		return self.target_table_cache[hardmode]
+
+	# Challenge mode with three guesses left: the next guess has to leave a
+	# pool the one after can split with the target kept. Rather than
+	# partition the pool for every guess, check the target's bucket first,
+	# and only then whether Absurdle would actually pick it.
+	def exact_target_three(self, pool, hardmode):
+
+		buckets, above, rivals = self.target_tables(hardmode)
+		target = self.secret_index[hardmode]
+
+		size = len(pool)
+		limit = self.max_distinct_responses()
+
+		select = self.selector(pool)
+
+		candidates = {}
+		finishes = {}
+
+		for g, bucket in enumerate(buckets):
+
+			bits = pool.bits & bucket
+			bucket_size = bits.bit_count()
+
+			if (bucket_size > limit) or (bucket_size == size):
+				continue
+
+			# Absurdle keeps the biggest bucket, so the target's has to hold
+			# at least its share of the pool, and no less than the rivals.
+			if bucket_size * self.distinct_responses[g] < size:
+				continue
+
+			if any( (pool.bits & rival).bit_count() > bucket_size for rival in rivals[g] ):
+				continue
+
+			if bits not in candidates:
+				candidates[bits] = 1 if bucket_size == 1 else self.target_split_bits(pool.with_bits(bits), hardmode)
+
+			if not candidates[bits]:
+				continue
+
+			row = self.matrix.row(g)
+
+			if self.find_adversarial_match(Counter(select(row))) != row[target]:
+				continue
+
+			if bits not in finishes:
+
+				if bucket_size == 1:
+					finishes[bits] = [hardmode]
+
+				else:
+					split = self.exact_split(pool.with_bits(bits), hardmode, iter_bits(candidates[bits]))
+					finishes[bits] = None if split is None else [ self.possible_words[split[0]], split[1] ]
+
+			if finishes[bits] is not None:
+				return [self.possible_words[g]] + finishes[bits]
+
+		return None
+
+	# Guesses that might split the pool into single words, best first.
+	def split_candidates(self, pool, hardmode=None):
+
+		self.max_distinct_responses()
+
+		if hardmode is None:
+			return self.splitters
+
+		return iter_bits(self.target_split_bits(pool, hardmode))
+
+	# In challenge mode, a pool can only be split with the target kept by
+	# guesses ranking every other word above the target. Returns a bitset of
+	# those guesses.
+	def target_split_bits(self, pool, hardmode):
+
+		target = self.secret_index[hardmode]
+		above = self.target_tables(hardmode)[1]
+
+		candidates = (1 << len(self.possible_words)) - 1
+
+		for i in iter_bits(pool.bits):
+
+			if i != target:
+				candidates &= above[i]
+
+			if not candidates:
+				break
+
+		return candidates
+
+	# A guess splitting the pool into single words and the word Absurdle
+	# then keeps, or None. That's the only way to win from two or more words
+	# in two guesses. In challenge mode, the word kept must be the target.
+	def exact_split(self, pool, hardmode=None, guesses=None):
+
+		size = len(pool)
+		select = self.selector(pool)
+		rank = self.response_rank
+
+		if guesses is None:
+			guesses = self.split_candidates(pool, hardmode)
+
+		self.max_distinct_responses()
+
+		if hardmode is not None:
+			target = self.secret_index[hardmode]
+
+		for g in guesses:
+
+			if self.distinct_responses[g] < size:
+
+				if hardmode is None:
+					break
+
+				continue
+
+			row = self.matrix.row(g)
+			codes = select(row)
+
+			if len(set(codes)) != size:
+				continue
+
+			# With every bucket the same size, Absurdle keeps the one whose
+			# response ranks lowest.
+			kept = min(codes, key=rank.__getitem__)
+
+			if (hardmode is not None) and (row[target] != kept):
+				continue
+
+			return g, list(self.bucket(pool, codes, kept))[0]
+
+		return None
+
+	def do_wordle(self):
+
+		# Word lists without Wordle's answers (in order) just cycle through
+		# the secret words instead.
+		answers = self.wordle_answers or self.secret_words
 
 		#Create index into this list
 		index = mktime(date.today().timetuple()) - 1624057200
 		index = round(index / 86400)
-		index = index % len(secret_words)
+		index = index % len(answers)
 		
-		return secret_words[index]
+		return answers[index]
 
-		
+# Worker process state, for Pyrdle(jobs=N).
+worker = None
+
+def init_worker(location, bounded):
+
+	global worker
+	worker = Pyrdle(location, bounded=bounded)
+
+def run_shard(task):
+
+	method, args, bits, guesses = task
+	pool = worker.candidates.with_bits(bits)
+
+	evaluations = worker.evaluations
+	pruned = worker.pruned
+	equivalent = worker.equivalent
+
+	result = getattr(worker, method)(*args, pool, guesses)
+
+	return (result, worker.evaluations - evaluations, worker.pruned - pruned, worker.equivalent - equivalent)
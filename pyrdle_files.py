@@ -0,0 +1,24 @@
+#!/usr/bin/env python3
+
+from contextlib import contextmanager
+from os import getpid, remove, replace
+from os.path import exists
+
+# Opens a scratch file to write in place of the one at location, and moves
+# it into place once the block is done, so that a concurrent reader never
+# sees a half-written file. If the block fails, the scratch file is removed
+# and the old file (if any) is left alone.
+@contextmanager
+def atomic_write(location, mode="wb"):
+
+	scratch = f"{location}.{getpid()}.tmp"
+
+	try:
+		with open(scratch, mode) as f:
+			yield f
+
+		replace(scratch, location)
+
+	finally:
+		if exists(scratch):
+			remove(scratch)
@@ -0,0 +1,186 @@
+#!/usr/bin/env python3
+
+from collections import Counter
+from itertools import product
+from operator import itemgetter
+
+# Number of distinct responses for a word of the given length.
+def response_count(length):
+
+	return 3 ** length
+
+# Bytes needed to hold any response code for a word of the given length:
+# one for words of up to five letters, two for longer ones.
+def code_size(length):
+
+	return 1 if response_count(length) <= 256 else 2
+
+# Response code of one guess against one secret word, worked out directly.
+def response_code(guess, secret):
+
+	colours = [0] * len(guess)
+	unmatched = Counter()
+
+	for i, (g, s) in enumerate(zip(guess, secret)):
+		if g == s:
+			colours[i] = 2
+		else:
+			unmatched[s] += 1
+
+	for i, g in enumerate(guess):
+		if (colours[i] == 0) and unmatched[g]:
+			colours[i] = 1
+			unmatched[g] -= 1
+
+	code = 0
+	for c in colours:
+		code = (3 * code) + c
+
+	return code
+
+# equal_tables[c] translates byte c to "1" and every other byte to "0".
+equal_tables = {}
+
+# Bitset of the positions in a row of response codes (given as raw bytes,
+# size bytes per code, little-endian) that hold the given code.
+def matching_bits(raw, code, size=1):
+
+	bits = -1
+
+	for k in range(size):
+
+		c = (code >> (8 * k)) & 0xff
+
+		if c not in equal_tables:
+			equal_tables[c] = bytes( ord("1") if b == c else ord("0") for b in range(256) )
+
+		bits &= int(raw[k::size].translate(equal_tables[c])[::-1], 2)
+
+	return bits
+
+# Returns a function picking the given indices out of a sequence, as a tuple.
+def selector(indices):
+
+	if len(indices) == 0:
+		return lambda row : ()
+
+	if len(indices) == 1:
+		i = indices[0]
+		return lambda row : (row[i],)
+
+	return itemgetter(*indices)
+
+# A list of bucket sizes, indexed by response code.
+def bincount(codes, size):
+
+	counts = [0] * size
+
+	for code, count in Counter(codes).items():
+		counts[code] = count
+
+	return counts
+
+# A list of words, encoded so that the response codes of one guess against
+# every word can be worked out with a handful of big-integer operations.
+#
+# Each encoded value is an integer holding one "lane" per word, of size bytes
+# (enough for any response code): lane j of equal[i][c] is 1 if word j has
+# letter c at position i, and lane j of at_least[c][k] is 1 if word j
+# contains letter c at least k times. Lanes only ever hold 0 or 1, so &, |
+# and ^ work lane-by-lane, and since the largest response code fits in a
+# lane, adding up weighted lanes never carries.
+class EncodedWords(object):
+
+	def __init__(self, words, size=1):
+
+		self.words = words
+		self.lane_size = size
+		self.size = len(words)
+		self.ones = int.from_bytes(b"\1".ljust(size, b"\0") * self.size, "little")
+
+		length = len(words[0]) if words else 0
+
+		self.weights = [ 3 ** (length - i - 1) for i in range(length) ]
+
+		equal = [ {} for i in range(length) ]
+		at_least = {}
+
+		for j, word in enumerate(words):
+
+			lane = 1 << (8 * size * j)
+
+			for i, c in enumerate(word):
+				equal[i][c] = equal[i].get(c, 0) | lane
+
+			for c in set(word):
+
+				counts = at_least.setdefault(c, [self.ones])
+
+				for k in range(1, word.count(c) + 1):
+
+					if k == len(counts):
+						counts.append(0)
+
+					counts[k] |= lane
+
+		self.equal = equal
+		self.at_least = at_least
+
+	def count_at_least(self, letter, k):
+
+		counts = self.at_least.get(letter)
+
+		if (counts is None) or (k >= len(counts)):
+			return 0
+
+		return counts[k]
+
+	# Response codes of a guess against every encoded word: as bytes, or as
+	# a memoryview of 16-bit codes if the lanes are two bytes wide.
+	def feedback(self, guess):
+
+		positions = {}
+
+		for i, c in enumerate(guess):
+			positions.setdefault(c, []).append(i)
+
+		total = 0
+
+		for c, ps in positions.items():
+
+			greens = [ self.equal[p].get(c, 0) for p in ps ]
+
+			if len(ps) == 1:
+
+				# Green lanes are also "has c" lanes, so this gives 2 for
+				# green, 1 for yellow and 0 for white.
+				total += self.weights[ps[0]] * (greens[0] + self.count_at_least(c, 1))
+				continue
+
+			# With repeated letters, the k-th occurrence of c (if not green)
+			# is yellow if the word has more c's than the k earlier
+			# occurrences plus the greens among the later ones account for.
+			for k, p in enumerate(ps):
+
+				green = greens[k]
+				later = greens[k + 1:]
+
+				yellow = 0
+
+				for pattern in product((0, 1), repeat=len(later)):
+
+					lanes = self.count_at_least(c, k + 1 + sum(pattern))
+
+					for bit, lg in zip(pattern, later):
+						lanes &= lg if bit else (self.ones ^ lg)
+
+					yellow |= lanes
+
+				total += self.weights[p] * ((2 * green) + (yellow & (self.ones ^ green)))
+
+		codes = total.to_bytes(self.size * self.lane_size, "little")
+
+		if self.lane_size == 1:
+			return codes
+
+		return memoryview(codes).cast("H")
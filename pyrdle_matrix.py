@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+
+import mmap
+from hashlib import sha1
+from os.path import exists, getsize
+
+from pyrdle_cache import TranspositionTable
+from pyrdle_files import atomic_write
+from pyrdle_kernel import EncodedWords, response_code
+
+# The full possible_words x secret_words table of response codes, code_size
+# bytes per pair. It's built once, saved to disk and memory-mapped
+# thereafter, so that several processes can share the same copy.
+class ResponseMatrix(object):
+
+	magic = b"PYRDLEM1"
+	header_size = 64
+
+	# Responses are read from the table, so rows and columns are cheap.
+	stored = True
+
+	def __init__(self, guesses, secrets, location, digest=None, code_size=1):
+
+		self.location = location
+		self.n_guesses = len(guesses)
+		self.n_secrets = len(secrets)
+		self.code_size = code_size
+		self.digest = self.fingerprint(guesses, secrets) if (digest is None) else digest
+
+		if not self.is_valid():
+			self.build(guesses, secrets)
+
+		with open(self.location, "rb") as f:
+			self.map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+		self.view = memoryview(self.map)[self.header_size:]
+
+		if code_size == 2:
+			self.view = self.view.cast("H")
+
+	@staticmethod
+	def size(n_guesses, n_secrets, code_size=1):
+
+		return ResponseMatrix.header_size + (n_guesses * n_secrets * code_size)
+
+	@staticmethod
+	def fingerprint(guesses, secrets):
+
+		h = sha1()
+		h.update(",".join(secrets).encode())
+		h.update(b"\n")
+		h.update(",".join(guesses).encode())
+
+		return h.digest()
+
+	def header(self):
+
+		h = self.magic + self.digest
+		h += self.n_guesses.to_bytes(4, "little") + self.n_secrets.to_bytes(4, "little") + self.code_size.to_bytes(4, "little")
+
+		return h.ljust(self.header_size, b"\0")
+
+	def is_valid(self):
+
+		if not exists(self.location):
+			return False
+
+		if getsize(self.location) != self.size(self.n_guesses, self.n_secrets, self.code_size):
+			return False
+
+		with open(self.location, "rb") as f:
+			return f.read(self.header_size) == self.header()
+
+	def build(self, guesses, secrets):
+
+		with atomic_write(self.location) as f:
+
+			f.write(self.header())
+
+			encoded = EncodedWords(secrets, self.code_size)
+
+			for guess in guesses:
+				f.write(encoded.feedback(guess))
+
+	def row(self, guess_index):
+
+		start = guess_index * self.n_secrets
+
+		return self.view[start : start + self.n_secrets]
+
+	# Response codes of every guess against one secret word: as bytes, or as
+	# a list with two-byte codes.
+	def column(self, secret_index):
+
+		column = self.view[secret_index :: self.n_secrets]
+
+		return bytes(column) if (self.code_size == 1) else column.tolist()
+
+	def code(self, guess_index, secret_index):
+
+		return self.view[(guess_index * self.n_secrets) + secret_index]
+
+# Stands in for a ResponseMatrix that would be too big to keep: rows are
+# worked out when asked for, and the most recently used are kept, so memory
+# only grows with the number of words rather than with their product.
+# Columns mean working out every guess's response one at a time, and are
+# slow.
+class ComputedResponses(object):
+
+	stored = False
+	row_cache_size = 4096
+
+	def __init__(self, guesses, secrets, digest=None, code_size=1):
+
+		self.guesses = guesses
+		self.secrets = secrets
+		self.n_guesses = len(guesses)
+		self.n_secrets = len(secrets)
+		self.code_size = code_size
+		self.digest = ResponseMatrix.fingerprint(guesses, secrets) if (digest is None) else digest
+
+		self.encoded = EncodedWords(secrets, code_size)
+		self.rows = TranspositionTable(self.row_cache_size)
+
+	def row(self, guess_index):
+
+		row = self.rows.get(guess_index)
+
+		if row is None:
+			row = self.encoded.feedback(self.guesses[guess_index])
+			self.rows.put(guess_index, row)
+
+		return row
+
+	def column(self, secret_index):
+
+		secret = self.secrets[secret_index]
+		column = [ response_code(guess, secret) for guess in self.guesses ]
+
+		return bytes(column) if (self.code_size == 1) else column
+
+	def code(self, guess_index, secret_index):
+
+		return response_code(self.guesses[guess_index], self.secrets[secret_index])
@@ -0,0 +1,307 @@
+#!/usr/bin/env python3
+
+import argparse
+import asyncio
+import json as JSON
+from itertools import count
+from random import Random
+from time import perf_counter
+
+from pyrdle_candidates import CandidateSet
+from pyrdle_core import Pyrdle
+
+# Session ids are plain integers (JSON true and false don't count).
+def is_session_id(value):
+
+	return isinstance(value, int) and not isinstance(value, bool)
+
+# A game in progress. The pool of words Absurdle could still pick is kept as
+# a bare bitset over the (shared) secret words.
+class Session(object):
+
+	__slots__ = ("bits", "guesses", "target")
+
+	def __init__(self, bits, target=None):
+
+		self.bits = bits
+		self.guesses = 0
+		self.target = target
+
+# Hosts any number of Absurdle games over newline-delimited JSON. Every
+# session shares one Pyrdle instance (and so one copy of the word lists and
+# response matrix), and only holds a Session of its own.
+#
+# Requests are JSON objects, one per line, and each gets one line back. Any
+# "id" in a request is echoed in its reply.
+#   {"op": "new"}                          -> {"session": 1}
+#   {"op": "new", "target": "AZURE"}       -> {"session": 2, "target": "AZURE"}
+#   {"op": "new", "challenge": true}       -> {"session": 3, "target": <random>}
+#   {"op": "guess", "session": 1, "guess": "AESIR"}
+#       -> {"response": "00000", "emoji": ..., "guesses": 1, "remaining": 168,
+#           "won": false, "lost": false}
+#   {"op": "end", "session": 1}            -> {"ended": true}
+# Errors come back as {"error": "..."}.
+class PyrdleServer(object):
+
+	# Pending connections to queue, so that bursts of clients get through.
+	backlog = 1024
+
+	def __init__(self, pyrdle=None, max_sessions=100000, seed=None):
+
+		self.pyrdle = Pyrdle() if (pyrdle is None) else pyrdle
+		self.max_sessions = max_sessions
+
+		self.full = CandidateSet.full(self.pyrdle.secret_words, self.pyrdle.secret_index)
+		self.win = len(self.pyrdle.responses) - 1
+
+		self.sessions = {}
+		self.ids = count(1)
+		self.random = Random(seed)
+
+		self.requests = 0
+
+	# Absurdle's response code to a guess, and the pool left afterwards.
+	# Steps from the same pool with the same guess (every game's opening,
+	# most obviously) are remembered by simulate rather than recomputed.
+	def step(self, bits, guess):
+
+		codes, states = self.pyrdle.simulate([bits], [guess])
+
+		return codes[0], states[0]
+
+	def new_session(self, request):
+
+		if len(self.sessions) >= self.max_sessions:
+			return { "error" : "Too many sessions" }
+
+		target = request.get("target")
+
+		if target is not None:
+
+			if not isinstance(target, str):
+				return { "error" : "target must be a string" }
+
+			target = target.upper()
+
+			if target not in self.pyrdle.secret_index:
+				return { "error" : f"Target word {target} is not in the list of secret words" }
+
+		elif request.get("challenge"):
+			target = self.random.choice(self.pyrdle.secret_words)
+
+		session_id = next(self.ids)
+		self.sessions[session_id] = Session(self.full.bits, target)
+
+		reply = { "session" : session_id }
+
+		if target is not None:
+			reply["target"] = target
+
+		return reply
+
+	def guess(self, request):
+
+		if not is_session_id(request.get("session")):
+			return { "error" : "session must be an integer" }
+
+		session = self.sessions.get(request["session"])
+
+		if session is None:
+			return { "error" : "No such session" }
+
+		if not isinstance(request.get("guess"), str):
+			return { "error" : "guess must be a string" }
+
+		guess = request["guess"].upper()
+
+		if guess not in self.pyrdle.guess_index:
+			return { "error" : "Please enter a valid word" }
+
+		code, session.bits = self.step(session.bits, guess)
+		session.guesses += 1
+
+		won = code == self.win
+		lost = (session.target is not None) and not ((session.bits >> self.pyrdle.secret_index[session.target]) & 1)
+
+		# Finished games are forgotten straight away.
+		if won or lost:
+			del self.sessions[request["session"]]
+
+		response = self.pyrdle.responses[code]
+
+		return {
+			"response" : response,
+			"emoji" : self.pyrdle.response_to_emoji(response),
+			"guesses" : session.guesses,
+			"remaining" : session.bits.bit_count(),
+			"won" : won,
+			"lost" : lost,
+		}
+
+	def end_session(self, request):
+
+		if not is_session_id(request.get("session")):
+			return { "error" : "session must be an integer" }
+
+		if self.sessions.pop(request["session"], None) is None:
+			return { "error" : "No such session" }
+
+		return { "ended" : True }
+
+	# Handles one decoded request, returning the reply.
+	def dispatch(self, request):
+
+		self.requests += 1
+
+		if not isinstance(request, dict):
+			return { "error" : "Requests must be JSON objects" }
+
+		op = request.get("op")
+
+		if op == "guess":
+			reply = self.guess(request)
+		elif op == "new":
+			reply = self.new_session(request)
+		elif op == "end":
+			reply = self.end_session(request)
+		else:
+			reply = { "error" : f"Unknown op {op}" }
+
+		if "id" in request:
+			reply["id"] = request["id"]
+
+		return reply
+
+	async def handle(self, reader, writer):
+
+		try:
+			while True:
+
+				line = await reader.readline()
+
+				if not line:
+					break
+
+				try:
+					request = JSON.loads(line)
+				except ValueError:
+					request = None
+
+				# Whatever goes wrong with one request, the client gets an
+				# error back and the connection stays open.
+				try:
+					reply = self.dispatch(request)
+				except Exception as e:
+
+					reply = { "error" : f"Could not handle the request: {e}" }
+
+					if "id" in request:
+						reply["id"] = request["id"]
+
+				writer.write(JSON.dumps(reply).encode() + b"\n")
+				await writer.drain()
+
+		except ConnectionError:
+			pass
+
+		finally:
+			writer.close()
+
+	async def start(self, host="127.0.0.1", port=0, path=None):
+
+		if path is not None:
+			return await asyncio.start_unix_server(self.handle, path=path, backlog=self.backlog)
+
+		return await asyncio.start_server(self.handle, host=host, port=port, backlog=self.backlog)
+
+# Plays games against a running server from many connections at once, each
+# game making up to the given number of guesses picked at random from words,
+# and returns the round-trip time of every guess.
+async def load_test(connect, words, sessions=100, guesses=6, seed=None):
+
+	random = Random(seed)
+	latencies = []
+
+	async def play():
+
+		reader, writer = await connect()
+
+		async def call(request):
+
+			writer.write(JSON.dumps(request).encode() + b"\n")
+			await writer.drain()
+
+			return JSON.loads(await reader.readline())
+
+		session = (await call({ "op" : "new" }))["session"]
+
+		for i in range(guesses):
+
+			T1 = perf_counter()
+			reply = await call({ "op" : "guess", "session" : session, "guess" : random.choice(words) })
+			latencies.append(perf_counter() - T1)
+
+			if reply["won"]:
+				break
+
+		else:
+			await call({ "op" : "end", "session" : session })
+
+		writer.close()
+
+	await asyncio.gather(*( play() for i in range(sessions) ))
+
+	return latencies
+
+async def main(args):
+
+	server = PyrdleServer(Pyrdle(args.words), max_sessions=args.max_sessions)
+	listener = await server.start(args.host, args.port, args.socket)
+
+	if args.socket is not None:
+		address = args.socket
+		connect = lambda : asyncio.open_unix_connection(args.socket)
+	else:
+		host, port = listener.sockets[0].getsockname()[:2]
+		address = f"{host}:{port}"
+		connect = lambda : asyncio.open_connection(host, port)
+
+	if args.load_test is None:
+
+		print(f"Serving Absurdle on {address}")
+
+		async with listener:
+			await listener.serve_forever()
+
+	else:
+
+		T1 = perf_counter()
+		latencies = await load_test(connect, server.pyrdle.possible_words, args.load_test)
+		T2 = perf_counter()
+
+		listener.close()
+		await listener.wait_closed()
+
+		latencies.sort()
+		p50 = latencies[len(latencies) // 2]
+		p99 = latencies[min(len(latencies) - 1, (99 * len(latencies)) // 100)]
+
+		print(f"Played {args.load_test} concurrent games on {address}: {len(latencies)} guesses in {(T2 - T1):.3f}s ({len(latencies) / (T2 - T1):.0f} guesses/s).")
+		print(f"Guess latency: p50 {1000 * p50:.2f}ms, p99 {1000 * p99:.2f}ms, max {1000 * latencies[-1]:.2f}ms.")
+
+if __name__ == "__main__":
+
+	parser = argparse.ArgumentParser(description="Host Absurdle games over newline-delimited JSON, on a TCP port or a Unix socket.")
+	parser.add_argument("--host", default="127.0.0.1", required=False, type=str, help="Address to listen on. Defaults to 127.0.0.1 if not set.")
+	parser.add_argument("--port", default=8767, required=False, type=int, help="TCP port to listen on. Defaults to 8767 if not set.")
+	parser.add_argument("--socket", default=None, required=False, type=str, help="Listen on this Unix socket instead of a TCP port.")
+	parser.add_argument("--max-sessions", default=100000, required=False, type=int, help="Most games to host at once. Defaults to 100000 if not set.")
+	parser.add_argument("--words", default=None, required=False, type=str, metavar="FILE", help="Word list to use, in the same format as words.dat. Defaults to ./words.dat if not set.")
+	parser.add_argument("--load-test", default=None, required=False, type=int, metavar="N", help="Instead of serving, play N concurrent random games against the server and report its throughput and latency.")
+
+	args = parser.parse_args()
+
+	if (args.load_test is not None) and (args.socket is None):
+		args.port = 0
+
+	asyncio.run(main(args))
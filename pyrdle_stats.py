@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+
+from collections import Counter
+from time import perf_counter
+
+# Adds the time spent inside a with block to one of a Stats' timers.
+class Timer(object):
+
+	__slots__ = ("stats", "name", "started")
+
+	def __init__(self, stats, name):
+
+		self.stats = stats
+		self.name = name
+
+	def __enter__(self):
+
+		self.started = perf_counter()
+
+	def __exit__(self, *exc):
+
+		self.stats.add_time(self.name, perf_counter() - self.started)
+
+# Counters, timers and per-level statistics for one Pyrdle instance. Pyrdle
+# only keeps one of these when asked to (its stats attribute is None
+# otherwise), so that uninstrumented runs pay nothing but a few "is None"
+# checks outside the inner loops.
+class Stats(object):
+
+	version = 1
+
+	def __init__(self):
+
+		self.counters = Counter()
+		self.timers = {}
+		self.levels = []
+		self.started = perf_counter()
+
+	def count(self, name, n=1):
+
+		self.counters[name] += n
+
+	def add_time(self, name, seconds):
+
+		timer = self.timers.get(name)
+
+		if timer is None:
+			self.timers[name] = [1, seconds]
+		else:
+			timer[0] += 1
+			timer[1] += seconds
+
+	def timer(self, name):
+
+		return Timer(self, name)
+
+	# Where a Pyrdle's running totals stand, for working out what one level
+	# of a search cost.
+	def snapshot(self, pyrdle):
+
+		return (perf_counter(), pyrdle.evaluations, pyrdle.pruned, pyrdle.equivalent)
+
+	# Records one level of a search: the work done since the snapshot was
+	# taken, plus whatever else the solver wants to note.
+	def level(self, solver, snapshot, pyrdle, **fields):
+
+		started, evaluations, pruned, equivalent = snapshot
+
+		entry = { "solver" : solver, "level" : len([ l for l in self.levels if l["solver"] == solver ]) + 1 }
+		entry.update(fields)
+
+		entry["evaluations"] = pyrdle.evaluations - evaluations
+		entry["pruned"] = pyrdle.pruned - pruned
+		entry["equivalent"] = pyrdle.equivalent - equivalent
+		entry["seconds"] = perf_counter() - started
+
+		self.levels.append(entry)
+
+	def report(self):
+
+		return {
+			"version" : self.version,
+			"seconds" : perf_counter() - self.started,
+			"counters" : dict(sorted(self.counters.items())),
+			"timers" : { name : { "calls" : calls, "seconds" : seconds } for name, (calls, seconds) in sorted(self.timers.items()) },
+			"levels" : self.levels,
+		}
+
+	def print_report(self):
+
+		if self.counters:
+
+			print("Counters:")
+			for name, n in sorted(self.counters.items()):
+				print(f"  {name:32s} {n:10d}")
+			print("")
+
+		if self.timers:
+
+			print("Timers:")
+			for name, (calls, seconds) in sorted(self.timers.items(), key=lambda x : -x[1][1]):
+				print(f"  {name:32s} {calls:10d} calls {seconds:10.3f}s")
+			print("")
+
+		if self.levels:
+
+			print("Levels:")
+			print(f"  {'solver':8s} {'level':>5s} {'pools':>6s} {'smallest':>8s} {'largest':>8s} {'evaluated':>10s} {'abandoned':>10s} {'skipped':>10s} {'time':>9s}")
+
+			for l in self.levels:
+				print(f"  {l['solver']:8s} {l['level']:5d} {l.get('pools', 1):6d} {l.get('smallest', 0):8d} {l.get('largest', 0):8d} {l['evaluations'] + l['pruned']:10d} {l['pruned']:10d} {l['equivalent']:10d} {l['seconds']:8.3f}s")
+
+			print("")
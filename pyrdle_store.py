@@ -0,0 +1,211 @@
+#!/usr/bin/env python3
+
+import mmap
+from hashlib import sha1
+from itertools import takewhile
+from os.path import exists
+
+from pyrdle_files import atomic_write
+from pyrdle_kernel import response_count
+
+# Streams the words in a word list, as (line number, word) pairs, without
+# reading the whole file in at once. In words.dat, line 0 holds the secret
+# words, line 1 the other allowed guesses and line 2 (optionally) Wordle's
+# answers in the order they're used. Words are upper-cased.
+def iter_words(f, chunk_size=1 << 16):
+
+	line = 0
+	rest = ""
+
+	while True:
+
+		chunk = f.read(chunk_size)
+		fields = (rest + chunk).split(",")
+
+		# The last field may carry on into the next chunk.
+		rest = fields.pop() if chunk else ""
+
+		for field in fields + ([rest] if not chunk else []):
+
+			for i, word in enumerate(field.split("\n")):
+
+				if i:
+					line += 1
+
+				word = word.strip().upper()
+
+				if word:
+					yield line, word
+
+		if not chunk:
+			return
+
+# sha1 of a file, read a chunk at a time.
+def file_digest(location, chunk_size=1 << 16):
+
+	h = sha1()
+
+	with open(location, "rb") as f:
+		for chunk in iter(lambda : f.read(chunk_size), b""):
+			h.update(chunk)
+
+	return h.digest()
+
+# Bitmask of the letters in a word, with bit 0 for A up to bit 25 for Z.
+def letter_mask(word):
+
+	mask = 0
+
+	for c in word:
+		mask |= 1 << (ord(c) - 65)
+
+	return mask
+
+# A compiled copy of words.dat, so that it can be loaded without parsing.
+# Built automatically next to the word list, and rebuilt if it changes.
+# rank_responses is called with the word length to work out the response
+# ranks when building. Every word in the list must have the same length,
+# from 4 to 8 letters.
+#
+# Layout (integers little-endian):
+#   0    magic
+#   8    sha1 of words.dat
+#   28   fingerprint of the secret and guess lists (see ResponseMatrix)
+#   48   number of other words, secret words and Wordle answers, and the
+#        word length (4 bytes each)
+#   64   the response tie-break rank of each response code, two bytes each
+#   ...  every guess (other words, then secret words), then the Wordle
+#        answers, as packed records of word length bytes
+#   ...  letter_mask of every guess, 4 bytes each, 4-byte aligned
+class WordStore(object):
+
+	magic = b"PYRDLEW2"
+	header_size = 64
+	min_length = 4
+	max_length = 8
+
+	def __init__(self, source, location, rank_responses):
+
+		self.source = source
+		self.location = location
+		self.source_digest = file_digest(source)
+
+		if not self.is_valid():
+			self.build(rank_responses)
+
+		with open(self.location, "rb") as f:
+			self.map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+		n_others, n_secrets, n_answers, L = self.counts(self.map)
+
+		self.word_length = L
+		self.digest = bytes(self.map[28:48])
+		self.ranks = memoryview(self.map)[self.header_size : self.records_offset(L)].cast("H").tolist()
+
+		n_guesses = n_others + n_secrets
+		start = self.records_offset(L)
+		records = self.map[start : start + (L * (n_guesses + n_answers))].decode("ascii")
+
+		words = [ records[i : i + L] for i in range(0, len(records), L) ]
+
+		self.possible_words = words[:n_guesses]
+		self.secret_words = words[n_others:n_guesses]
+		self.wordle_answers = words[n_guesses:]
+
+		self.masks = memoryview(self.map)[self.masks_offset(L, n_guesses + n_answers) :][: 4 * n_guesses].cast("I")
+
+	@staticmethod
+	def counts(header):
+
+		return tuple( int.from_bytes(header[i : i + 4], "little") for i in (48, 52, 56, 60) )
+
+	def records_offset(self, length):
+
+		return self.header_size + (2 * response_count(length))
+
+	def masks_offset(self, length, n_records):
+
+		end = self.records_offset(length) + (length * n_records)
+
+		return (end + 3) & ~3
+
+	def is_valid(self):
+
+		if not exists(self.location):
+			return False
+
+		with open(self.location, "rb") as f:
+			header = f.read(self.header_size)
+
+		return (len(header) == self.header_size) and (header[:8] == self.magic) and (header[8:28] == self.source_digest)
+
+	# The words in the order they're stored, as (line, word) pairs: other
+	# words (line 1), secret words (line 0), then Wordle answers (line 2).
+	@staticmethod
+	def store_order(f, secret_words):
+
+		secrets_done = False
+
+		for line, word in iter_words(f):
+
+			if (line >= 2) and not secrets_done:
+				yield from ( (0, w) for w in secret_words )
+				secrets_done = True
+
+			if line in (1, 2):
+				yield line, word
+
+		if not secrets_done:
+			yield from ( (0, w) for w in secret_words )
+
+	# Streams the word list into the store. Only the secret words are held
+	# in memory, as they're stored after the other words.
+	def build(self, rank_responses):
+
+		with open(self.source, "r") as f:
+			secret_words = [ word for line, word in takewhile(lambda x : x[0] == 0, iter_words(f)) ]
+
+		if not secret_words:
+			raise ValueError(f"No secret words found in {self.source}")
+
+		L = len(secret_words[0])
+
+		if not (self.min_length <= L <= self.max_length):
+			raise ValueError(f"Words must have from {self.min_length} to {self.max_length} letters, not {L}")
+
+		# Numbers of secret words, other words and answers, by line.
+		counts = [0, 0, 0]
+		masks = bytearray()
+
+		# As ResponseMatrix.fingerprint, a word at a time.
+		fingerprint = sha1()
+		fingerprint.update(",".join(secret_words).encode())
+		fingerprint.update(b"\n")
+
+		with open(self.source, "r") as f, atomic_write(self.location) as out:
+
+			out.write(b"\0" * self.header_size)
+			out.write(b"".join( r.to_bytes(2, "little") for r in rank_responses(L) ))
+
+			for line, word in self.store_order(f, secret_words):
+
+				if (len(word) != L) or not (word.isascii() and word.isalpha()):
+					raise ValueError(f"Every word in {self.source} must be {L} letters from A to Z, not {word}")
+
+				out.write(word.encode("ascii"))
+
+				if line != 2:
+					fingerprint.update(("," + word if (counts[0] or counts[1]) else word).encode())
+					masks += letter_mask(word).to_bytes(4, "little")
+
+				counts[line] += 1
+
+			n_records = sum(counts)
+			out.write(b"\0" * (self.masks_offset(L, n_records) - self.records_offset(L) - (L * n_records)))
+			out.write(masks)
+
+			header = self.magic + self.source_digest + fingerprint.digest()
+			header += b"".join( n.to_bytes(4, "little") for n in (counts[1], counts[0], counts[2], L) )
+
+			out.seek(0)
+			out.write(header)
@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+
+import mmap
+from bisect import bisect_left
+from os.path import exists, getsize
+
+from pyrdle_files import atomic_write
+
+# A complete Wordle strategy, saved as a tree of guesses: each node holds a
+# guess, and a child for each response it can get other than all green.
+# The file is memory-mapped and read a node at a time, so a lookup only
+# touches the nodes on its own path. Like the opening book, it's tied to
+# the word lists' fingerprint, and to the metric it was built with.
+#
+# Layout (integers little-endian, offsets and node references in 4-byte
+# words from the start of the file):
+#   0    magic
+#   8    fingerprint of the secret and guess lists (see ResponseMatrix)
+#   28   metric, ASCII, zero-padded to 12 bytes
+#   40   number of nodes, number of guesses (4 bytes each)
+#   64   the root node, then the rest, breadth first
+# Each node is the guess index and number of children n (4 bytes each), the
+# response codes of its children in ascending order (2 bytes each, padded
+# to a 4-byte boundary), then the offsets of its children (4 bytes each).
+class DecisionTree(object):
+
+	magic = b"PYRDLET1"
+	header_size = 64
+
+	def __init__(self, location, digest, metric):
+
+		self.location = location
+		self.digest = digest
+		self.metric = metric
+		self.map = None
+
+	def header(self, n_nodes, n_guesses):
+
+		h = self.magic + self.digest + self.metric.encode("ascii").ljust(12, b"\0")
+		h += n_nodes.to_bytes(4, "little") + n_guesses.to_bytes(4, "little")
+
+		return h.ljust(self.header_size, b"\0")
+
+	def is_valid(self):
+
+		if not exists(self.location) or (getsize(self.location) < self.header_size):
+			return False
+
+		with open(self.location, "rb") as f:
+			header = f.read(self.header_size)
+
+		return header[:40] == self.header(0, 0)[:40]
+
+	# The tree is only mapped the first time it's needed. Returns False if
+	# there isn't a valid one.
+	def load(self):
+
+		if self.map is not None:
+			return True
+
+		if not self.is_valid():
+			return False
+
+		with open(self.location, "rb") as f:
+			self.map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+		self.words = memoryview(self.map).cast("I")
+		self.halves = memoryview(self.map).cast("H")
+
+		return True
+
+	def __len__(self):
+
+		if not self.load():
+			return 0
+
+		return self.words[10]
+
+	def root(self):
+
+		return self.header_size // 4
+
+	# Index of the guess to make at a node.
+	def guess(self, node):
+
+		return self.words[node]
+
+	# The node reached from this one by the given response, or None if the
+	# response can't happen (or is all green).
+	def child(self, node, code):
+
+		n = self.words[node + 1]
+		start = node + 2
+
+		codes = self.halves[2 * start : (2 * start) + n]
+		i = bisect_left(codes, code)
+
+		if (i == n) or (codes[i] != code):
+			return None
+
+		return self.words[start + ((n + 1) // 2) + i]
+
+	# The node reached by following a sequence of responses from the root,
+	# or None if they leave the tree.
+	def walk(self, codes):
+
+		if not self.load():
+			return None
+
+		node = self.root()
+
+		for code in codes:
+
+			node = self.child(node, code)
+
+			if node is None:
+				return None
+
+		return node
+
+	# Saves a tree given as a list of nodes, root first, each one a guess
+	# index and a list of (response code, child node index) pairs.
+	def save(self, nodes, n_guesses):
+
+		# Every node's offset, in words.
+		offsets = []
+		offset = self.root()
+
+		for guess, children in nodes:
+			offsets.append(offset)
+			offset += 2 + ((len(children) + 1) // 2) + len(children)
+
+		data = bytearray(self.header(len(nodes), n_guesses))
+
+		for guess, children in nodes:
+
+			children = sorted(children)
+
+			data += guess.to_bytes(4, "little") + len(children).to_bytes(4, "little")
+			data += b"".join( code.to_bytes(2, "little") for code, child in children ).ljust(4 * ((len(children) + 1) // 2), b"\0")
+			data += b"".join( offsets[child].to_bytes(4, "little") for code, child in children )
+
+		with atomic_write(self.location) as f:
+			f.write(data)
+
+		# Drop any old mapping, so the new tree is read next time.
+		self.map = None
@@ -0,0 +1,264 @@
+#!/usr/bin/env python3
+
+from collections import Counter, deque
+from math import log
+from os.path import splitext
+
+from pyrdle_candidates import CandidateSet
+from pyrdle_core import Pyrdle
+from pyrdle_tree import DecisionTree
+
+# A cooperative Wordle solver, sharing Pyrdle's word lists and response
+# matrix. Guesses are picked to split the pool of possible secret words as
+# evenly as possible, by one of two measures:
+#  - "entropy" maximises the expected information of the response;
+#  - "expected" minimises the expected number of words left afterwards.
+# Both come down to minimising a sum of f(bucket size) over the buckets a
+# guess splits the pool into, with f(c) = c log c or c^2 respectively.
+class Wordle(Pyrdle):
+
+	metrics = ("entropy", "expected")
+
+	# Pools up to this size are partitioned column by column.
+	column_pool_size = 256
+
+	def __init__(self, loc=None, metric="entropy", jobs=1, stats=False):
+
+		if metric not in self.metrics:
+			raise ValueError(f"Unknown metric {metric}, expected one of: {', '.join(self.metrics)}")
+
+		super().__init__(loc, jobs, stats=stats)
+
+		self.metric = metric
+		self.bucket_cost = self.bucket_costs(metric)
+
+		self.win = len(self.responses) - 1
+
+		# Best guess for each pool seen so far, keyed by pool bitset. The
+		# choice only depends on the pool, so games share their decisions.
+		self.decisions = {}
+
+		# The whole strategy, if it's been built for this word list.
+		self.tree = DecisionTree(f"{splitext(self.location)[0]}.{metric}.tree", self.matrix.digest, metric)
+
+	def bucket_costs(self, metric):
+
+		size = len(self.secret_words)
+
+		if metric == "entropy":
+			return [0.0] + [ c * log(c) for c in range(1, size + 1) ]
+
+		return [ c * c for c in range(size + 1) ]
+
+	# Reads a response typed as digits (0 = grey, 1 = yellow, 2 = green) or
+	# letters (B, W, - or . = grey, Y = yellow, G = green), returning its
+	# response code, or None if it isn't a valid response.
+	def parse_response(self, response):
+
+		digits = { "0" : "0", "1" : "1", "2" : "2", "B" : "0", "W" : "0", "-" : "0", ".": "0", "Y" : "1", "G" : "2" }
+
+		response = response.strip().upper()
+
+		if (len(response) != self.word_length) or any( c not in digits for c in response ):
+			return None
+
+		return int("".join( digits[c] for c in response ), 3)
+
+	# Score of a guess against a pool: expected information in bits, or the
+	# expected number of words left, depending on the metric.
+	def guess_score(self, guess, pool=None):
+
+		pool = self.candidate_set(pool)
+		n = len(pool)
+
+		cost = sum( self.bucket_cost[c] for c in Counter(self.feedback(guess, pool)).values() )
+
+		if self.metric == "entropy":
+			return (log(n) - (cost / n)) / log(2)
+
+		return cost / n
+
+	def best_guess(self, pool=None):
+
+		pool = self.candidate_set(pool)
+
+		# With one or two words left, guessing one of them can't be beaten.
+		if len(pool) <= 2:
+			return next(iter(pool), None)
+
+		if pool.bits not in self.decisions:
+
+			entry = self.book.get(pool.bits, f"wordle/{self.metric}")
+
+			if entry is not None:
+
+				if self.stats is not None:
+					self.stats.count("book_hits")
+
+				self.decisions[pool.bits] = entry["guess"]
+
+			else:
+				with self.timed("choose_guess"):
+					self.decisions[pool.bits] = self.choose_guess(pool, self.bucket_cost)
+
+		return self.possible_words[self.decisions[pool.bits]]
+
+	# The index of the guess splitting a pool best, where the cost of a
+	# split is the sum of bucket_cost over the sizes of its buckets.
+	def choose_guess(self, pool, bucket_cost):
+
+		# Lots of guesses split the pool in exactly the same way (most
+		# obviously, when the pool is small), so only score each distinct
+		# list of response codes once, for the first guess producing it.
+		count = len(self.possible_words)
+
+		if (len(pool) <= self.column_pool_size) and self.matrix.stored:
+
+			# For small pools, it's quicker to read the matrix a column at a
+			# time and zip the columns together. Adding the guesses in
+			# reverse means the first guess for each list sticks.
+			columns = [ self.matrix.column(i) for i in pool.indices() ]
+			patterns = dict(zip(reversed(list(zip(*columns))), range(count - 1, -1, -1)))
+
+		else:
+
+			select = self.selector(pool)
+			row = self.matrix.row
+
+			patterns = {}
+			for g in range(count):
+				patterns.setdefault(self.pack_codes(select(row(g))), g)
+
+		best = None
+
+		for codes, g in patterns.items():
+
+			# Ties go to guesses which might be the answer (the only way to
+			# get an all-green response), then to the earliest guess.
+			key = (sum(map(bucket_cost.__getitem__, Counter(codes).values())), self.win not in codes, g)
+
+			if (best is None) or (key < best):
+				best = key
+
+		return best[2]
+
+	# Adds the first two guesses for each metric to the opening book.
+	def build_book(self):
+
+		root = CandidateSet.full(self.secret_words, self.secret_index)
+
+		for metric in self.metrics:
+
+			cost = self.bucket_costs(metric)
+			g = self.choose_guess(root, cost)
+
+			self.book.put(root.bits, f"wordle/{metric}", { "guess" : g })
+
+			buckets = {}
+			for i, code in enumerate(self.matrix.row(g)):
+				buckets.setdefault(code, []).append(i)
+
+			for indices in buckets.values():
+
+				pool = CandidateSet.from_indices(self.secret_words, self.secret_index, indices)
+
+				if len(pool) > 2:
+					self.book.put(pool.bits, f"wordle/{metric}", { "guess" : self.choose_guess(pool, cost) })
+
+		super().build_book()
+
+	# The solver's guesses for every secret word in the pool (by default,
+	# every secret word), as a list of tree nodes, root first: each one a
+	# guess index and a list of (response code, child node index) pairs.
+	# Pools are partitioned as in solve_all, but breadth first, so that the
+	# nodes near the root end up next to each other.
+	def decision_tree(self, pool=None):
+
+		nodes = []
+		queue = deque([ (self.candidate_set(pool), None, None) ])
+
+		while queue:
+
+			pool, parent, response = queue.popleft()
+
+			guess = self.best_guess(pool)
+
+			if parent is not None:
+				nodes[parent][1].append((response, len(nodes)))
+
+			nodes.append((self.guess_index[guess], []))
+
+			buckets = {}
+			for i, code in zip(pool.indices(), self.feedback(guess, pool)):
+				buckets.setdefault(code, []).append(i)
+
+			for code, indices in sorted(buckets.items()):
+				if code != self.win:
+					queue.append((CandidateSet.from_indices(self.secret_words, self.secret_index, indices), len(nodes) - 1, code))
+
+		return nodes
+
+	def build_tree(self):
+
+		self.tree.save(self.decision_tree(), len(self.possible_words))
+
+	# The guess the saved tree makes after the given responses (as codes) to
+	# its earlier guesses, or None if the responses leave the tree.
+	def next_guess(self, codes):
+
+		node = self.tree.walk(codes)
+
+		if node is None:
+			return None
+
+		return self.possible_words[self.tree.guess(node)]
+
+	# Narrows down the candidates, given a guess and its response code.
+	def update(self, guess, code):
+
+		self.candidates = self.bucket(self.candidates, self.feedback(guess), code)
+
+	# The guesses the solver makes to find a secret word.
+	def solve_secret(self, secret):
+
+		self.reset()
+
+		found = []
+
+		while True:
+
+			guess = self.best_guess()
+			found.append(guess)
+
+			if guess == secret:
+				return found
+
+			self.update(guess, self.feedback_row(guess)[self.secret_index[secret]])
+
+	# Plays every word in the pool (by default, every secret word), and
+	# returns a Counter of {number of guesses : number of words}. Rather
+	# than playing one game per word, this walks the solver's decision tree,
+	# partitioning each pool by the response to its guess all at once.
+	def solve_all(self, pool=None):
+
+		distribution = Counter()
+		stack = [ (self.candidate_set(pool), 1) ]
+
+		while stack:
+
+			pool, depth = stack.pop()
+
+			guess = self.best_guess(pool)
+
+			buckets = {}
+			for i, code in zip(pool.indices(), self.feedback(guess, pool)):
+				buckets.setdefault(code, []).append(i)
+
+			for code, indices in buckets.items():
+
+				if code == self.win:
+					distribution[depth] += 1
+				else:
+					stack.append((CandidateSet.from_indices(self.secret_words, self.secret_index, indices), depth + 1))
+
+		return distribution